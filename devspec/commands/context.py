@@ -14,10 +14,7 @@ from typing import Optional
 import typer
 from rich.console import Console
 
-from devspec.core.graph_database import GraphDatabase
-from devspec.core.graph_sync import GraphSync
-from devspec.core.graph_query import GraphQuery
-from devspec.core.context_assembler import ContextAssembler, PHASES
+from devspec.core.context_assembler import PHASES
 
 # Console for error output (context output goes to stdout directly)
 console = Console(stderr=True)
@@ -51,6 +48,12 @@ def context(
         devspec context planning --focus feat_context_assembler
         devspec context coding --focus comp_graph_query
     """
+    # Deferred imports: core modules load only when this command runs
+    from devspec.core.graph_database import GraphDatabase
+    from devspec.core.graph_query import GraphQuery
+    from devspec.core.graph_sync import GraphSync
+    from devspec.core.context_assembler import ContextAssembler
+
     # Validate phase
     if phase not in PHASES:
         console.print(f"[red]Error:[/red] Invalid phase '{phase}'")
@@ -6,6 +6,7 @@ Feature: feat_cli_command_structure
 
 为 Claude Code 和 Gemini CLI 生成 slash command 文件，使 AI CLI 可直接调用 DevSpec 命令。
 """
+import os
 from pathlib import Path
 
 from rich.console import Console
@@ -193,6 +194,15 @@ After user confirms understanding:
 '''
 
 
+# Command files to generate: (path relative to project root, content, CLI label)
+SLASH_COMMANDS = (
+    (Path(".claude/commands/devspec-monitor.md"), CLAUDE_MONITOR_TEMPLATE, "Claude Code (monitor)"),
+    (Path(".gemini/commands/devspec-monitor.toml"), GEMINI_MONITOR_TEMPLATE, "Gemini CLI (monitor)"),
+    (Path(".claude/commands/devspec-collect-req.md"), CLAUDE_COLLECT_REQ_TEMPLATE, "Claude Code (collect-req)"),
+    (Path(".gemini/commands/devspec-collect-req.toml"), GEMINI_COLLECT_REQ_TEMPLATE, "Gemini CLI (collect-req)"),
+)
+
+
 def init() -> None:
     """
     Generate AI CLI slash command files.
@@ -201,51 +211,28 @@ def init() -> None:
     enabling direct invocation of DevSpec commands from AI assistants.
     Skips files that already exist.
     """
-    root_path = Path(".")
-
-    # Define command files to generate
-    commands = [
-        {
-            "path": root_path / ".claude" / "commands" / "devspec-monitor.md",
-            "content": CLAUDE_MONITOR_TEMPLATE,
-            "cli_name": "Claude Code (monitor)",
-        },
-        {
-            "path": root_path / ".gemini" / "commands" / "devspec-monitor.toml",
-            "content": GEMINI_MONITOR_TEMPLATE,
-            "cli_name": "Gemini CLI (monitor)",
-        },
-        {
-            "path": root_path / ".claude" / "commands" / "devspec-collect-req.md",
-            "content": CLAUDE_COLLECT_REQ_TEMPLATE,
-            "cli_name": "Claude Code (collect-req)",
-        },
-        {
-            "path": root_path / ".gemini" / "commands" / "devspec-collect-req.toml",
-            "content": GEMINI_COLLECT_REQ_TEMPLATE,
-            "cli_name": "Gemini CLI (collect-req)",
-        },
-    ]
-
     console.print("[bold blue]DevSpec Init: Generating AI CLI slash commands...[/bold blue]\n")
 
-    for cmd in commands:
-        path: Path = cmd["path"]
-        content: str = cmd["content"]
-        cli_name: str = cmd["cli_name"]
-
-        # Check if file already exists
-        if path.exists():
-            console.print(f"[yellow]⚠ {cli_name}: {path} already exists, skipping.[/yellow]")
-            continue
-
+    # 每个目录只创建一次；结果行汇总后一次性输出，避免逐行的 Rich 渲染
+    created_dirs = set()
+    lines = []
+    for path, content, cli_name in SLASH_COMMANDS:
         # Create parent directory if not exists
-        path.parent.mkdir(parents=True, exist_ok=True)
+        if path.parent not in created_dirs:
+            os.makedirs(path.parent, exist_ok=True)
+            created_dirs.add(path.parent)
+
+        # Write command file; exclusive create ("x") doubles as the existence check
+        try:
+            with path.open("x", encoding="utf-8") as f:
+                f.write(content.strip() + "\n")
+        except FileExistsError:
+            lines.append(f"[yellow]⚠ {cli_name}: {path} already exists, skipping.[/yellow]")
+            continue
 
-        # Write command file
-        path.write_text(content.strip() + "\n", encoding="utf-8")
+        lines.append(f"[green]✓[/green] {cli_name}: {path}")
 
-        console.print(f"[green]✓[/green] {cli_name}: {path}")
+    console.print("\n".join(lines))
 
     console.print("\n[bold green]Done![/bold green] You can now use:")
     console.print("  • Claude Code: [cyan]/devspec-monitor[/cyan], [cyan]/devspec-collect-req[/cyan]")
@@ -8,8 +8,6 @@ Feature: feat_cli_command_structure
 """
 from pathlib import Path
 
-from devspec.core.consistency import ConsistencyMonitor
-
 
 def monitor():
     """
@@ -18,6 +16,9 @@ def monitor():
     Invokes ConsistencyMonitor to compare PRD anchors with SpecGraph YAML definitions,
     then outputs a layered report and generates PRODUCT_DASHBOARD.md.
     """
+    # Deferred imports: core modules load only when this command runs
+    from devspec.core.consistency import ConsistencyMonitor
+
     root_path = Path(".")
     monitor_instance = ConsistencyMonitor(root_path)
     monitor_instance.run_check()
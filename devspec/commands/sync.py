@@ -14,13 +14,16 @@ import typer
 from rich.console import Console
 from rich.table import Table
 
-from devspec.core.graph_database import GraphDatabase
-from devspec.core.graph_sync import GraphSync
-
 console = Console()
 
 
-def sync() -> None:
+def sync(
+    force: bool = typer.Option(
+        False,
+        "--force",
+        help="Rebuild the database even if no YAML file has changed",
+    ),
+) -> None:
     """
     Synchronize all YAML spec files to the database.
 
@@ -29,7 +32,14 @@ def sync() -> None:
     (relationships), and domain APIs.
 
     The database is located at .specgraph/.runtime/specgraph.db
+
+    If no YAML file changed since the last sync, the rebuild is skipped
+    (use --force to rebuild anyway).
     """
+    # Deferred imports: core modules load only when this command runs
+    from devspec.core.graph_database import GraphDatabase
+    from devspec.core.graph_sync import GraphSync
+
     root_path = Path(".")
     spec_dir = root_path / ".specgraph"
 
@@ -50,7 +60,7 @@ def sync() -> None:
     console.print("\n[cyan]Syncing YAML files to database...[/cyan]")
     try:
         sync_engine = GraphSync(db, root_path)
-        result = sync_engine.sync_all()
+        result = sync_engine.sync_all(force=force)
 
         # Display results
         console.print("\n[green]✓ Sync completed successfully![/green]\n")
@@ -63,14 +73,14 @@ def sync() -> None:
         table.add_row("Nodes added", str(result.added))
         table.add_row("Nodes updated", str(result.updated))
         table.add_row("Edges created", str(result.edges_created))
+        table.add_row("Files unchanged", str(result.unchanged))
 
         console.print(table)
 
         # Display errors if any
         if result.errors:
             console.print(f"\n[yellow]Warnings/Errors:[/yellow] {len(result.errors)}")
-            for error in result.errors:
-                console.print(f"  • {error}")
+            console.print("\n".join(f"  • {error}" for error in result.errors))
 
         # Display domain API stats
         console.print("\n[cyan]Checking domain APIs...[/cyan]")
@@ -11,8 +11,6 @@ from pathlib import Path
 import typer
 from rich.console import Console
 
-from devspec.core.prd_validator import PRDValidator
-
 console = Console()
 
 
@@ -22,6 +20,9 @@ def validate_prd(prd_path: Path = Path("PRD.md")) -> None:
     Args:
         prd_path: PRD 文件路径，默认为当前目录的 PRD.md
     """
+    # 延迟导入：core 模块仅在执行该命令时加载
+    from devspec.core.prd_validator import PRDValidator
+
     console.print("[bold blue]DevSpec: Validating PRD format...[/bold blue]\n")
 
     # 检查文件是否存在
@@ -38,15 +39,17 @@ def validate_prd(prd_path: Path = Path("PRD.md")) -> None:
         console.print(
             f"[red]✗ Validation failed with {len(result.errors)} error(s):[/red]"
         )
-        for error in result.errors:
-            console.print(f"  [red]•[/red] {error}")
+        console.print(
+            "\n".join(f"  [red]•[/red] {error}" for error in result.errors)
+        )
 
         if result.warnings:
             console.print(
                 f"\n[yellow]⚠ {len(result.warnings)} warning(s):[/yellow]"
             )
-            for warning in result.warnings:
-                console.print(f"  [yellow]•[/yellow] {warning}")
+            console.print(
+                "\n".join(f"  [yellow]•[/yellow] {warning}" for warning in result.warnings)
+            )
 
         raise typer.Exit(1)
 
@@ -54,7 +57,8 @@ def validate_prd(prd_path: Path = Path("PRD.md")) -> None:
         console.print(
             f"[yellow]⚠ Validation passed with {len(result.warnings)} warning(s):[/yellow]"
         )
-        for warning in result.warnings:
-            console.print(f"  [yellow]•[/yellow] {warning}")
+        console.print(
+            "\n".join(f"  [yellow]•[/yellow] {warning}" for warning in result.warnings)
+        )
     else:
         console.print("[green]✓ PRD.md format is valid![/green]")
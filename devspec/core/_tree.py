@@ -0,0 +1,54 @@
+"""
+Spec Tree - Single-pass discovery of YAML files under .specgraph.
+
+Excluded directories are pruned while walking, so their contents are never
+listed, instead of being filtered out after a full recursive glob.
+
+Component: comp_spec_indexer
+Feature: feat_consistency_monitor
+"""
+
+import os
+from pathlib import Path
+from typing import AbstractSet, List
+
+
+# =============================================================================
+# Constants
+# =============================================================================
+
+YAML_SUFFIX = ".yaml"
+
+
+# =============================================================================
+# Public API
+# =============================================================================
+
+def scan_specgraph(
+    spec_dir: Path,
+    excluded_dirs: AbstractSet[str] = frozenset(),
+    excluded_files: AbstractSet[str] = frozenset(),
+) -> List[Path]:
+    """
+    Collect every *.yaml file under spec_dir in one os.walk pass.
+
+    Args:
+        spec_dir: Root directory to scan (usually .specgraph)
+        excluded_dirs: Directory names whose subtrees are skipped entirely
+        excluded_files: File names that are never returned
+
+    Returns:
+        List of YAML file paths, files of a directory before its subdirectories
+    """
+    yaml_files: List[Path] = []
+
+    for dirpath, dirnames, filenames in os.walk(spec_dir):
+        # Prune in place so os.walk never descends into excluded directories
+        dirnames[:] = [d for d in dirnames if d not in excluded_dirs]
+
+        base = Path(dirpath)
+        for name in filenames:
+            if name.endswith(YAML_SUFFIX) and name not in excluded_files:
+                yaml_files.append(base / name)
+
+    return yaml_files
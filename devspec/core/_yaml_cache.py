@@ -0,0 +1,126 @@
+"""
+YAML Cache - Process-wide LRU cache of parsed YAML files.
+
+Entries are keyed by absolute path and validated against the file's
+(st_mtime_ns, st_size) on every call, so an edited file is re-parsed while an
+unchanged one skips both the read and the parse.
+
+All parsing here goes through libyaml's CSafeLoader when PyYAML was built
+with it; parse_yaml() exposes the same loader for YAML already in memory.
+
+Component: comp_spec_indexer
+Feature: feat_consistency_monitor
+"""
+
+import copy
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Tuple
+
+import yaml
+
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:
+    from yaml import SafeLoader as _SafeLoader
+
+
+# =============================================================================
+# Constants
+# =============================================================================
+
+MAX_CACHE_ENTRIES = 100
+
+# Everything load_yaml() is expected to raise for a missing, unreadable or
+# malformed file; anything else is a bug and should propagate
+YAML_LOAD_ERRORS = (OSError, yaml.YAMLError)
+
+
+# =============================================================================
+# Module-level state
+# =============================================================================
+
+# abs_path -> ((mtime_ns, size), parsed_data)
+_cache: "OrderedDict[str, Tuple[Tuple[int, int], Any]]" = OrderedDict()
+
+# Guards _cache; parsing itself happens outside the lock
+_lock = threading.Lock()
+
+
+# =============================================================================
+# Public API
+# =============================================================================
+
+def load_yaml(path: Path) -> Any:
+    """
+    Load and parse a YAML file, reusing the cached result if unchanged.
+
+    A deep copy is returned so callers may mutate the data freely without
+    corrupting the cached entry.
+
+    Args:
+        path: Path to the YAML file
+
+    Returns:
+        Parsed YAML content (dict, list, scalar or None)
+
+    Raises:
+        OSError: If the file cannot be stat'ed or read
+        yaml.YAMLError: If the YAML syntax or the file encoding is invalid
+    """
+    key = str(Path(path).resolve())
+    st = Path(key).stat()
+    stamp = (st.st_mtime_ns, st.st_size)
+
+    with _lock:
+        entry = _cache.get(key)
+        if entry is not None and entry[0] == stamp:
+            _cache.move_to_end(key)
+            data = entry[1]
+        else:
+            entry = None
+
+    if entry is None:
+        # Hand the raw bytes to the loader; it detects the encoding itself, so
+        # there is no separate str decode pass before parsing
+        with open(key, "rb") as f:
+            data = yaml.load(f, Loader=_SafeLoader)
+
+        with _lock:
+            _cache[key] = (stamp, data)
+            _cache.move_to_end(key)
+            while len(_cache) > MAX_CACHE_ENTRIES:
+                _cache.popitem(last=False)
+
+    return copy.deepcopy(data)
+
+
+def parse_yaml(text: str) -> Any:
+    """
+    Parse YAML text with the fastest available safe loader.
+
+    Drop-in replacement for yaml.safe_load(text); not cached.
+
+    Raises:
+        yaml.YAMLError: If the YAML syntax is invalid
+    """
+    return yaml.load(text, Loader=_SafeLoader)
+
+
+def invalidate(path: Path) -> None:
+    """
+    Drop the cached entry for path, if any.
+
+    Call after writing a file, since a rewrite within the filesystem's
+    timestamp granularity may keep the same (mtime, size) stamp.
+    """
+    key = str(Path(path).resolve())
+    with _lock:
+        _cache.pop(key, None)
+
+
+def clear_cache() -> None:
+    """Drop every cached entry."""
+    with _lock:
+        _cache.clear()
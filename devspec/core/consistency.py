@@ -13,6 +13,7 @@ from typing import Dict, List, Set, Optional
 import datetime
 import sys
 from collections import defaultdict
+from operator import itemgetter
 from rich.console import Console
 from rich.table import Table
 from rich.text import Text
@@ -60,6 +61,8 @@ class ConsistencyMonitor:
         self.console.print("\n[bold cyan]Phase 2: PRD-YAML Consistency Check[/bold cyan]")
         prd_anchors = self.parser.parse_anchors(Path("PRD.md"))
         yaml_nodes = self.indexer.index_all()
+        for warning in self.indexer.warnings:
+            self.console.print(f"Warning: {warning}", style="yellow", markup=False)
         all_ids = set(prd_anchors.keys()) | set(yaml_nodes.keys())
 
         # 3. Categorize nodes by type
@@ -89,9 +92,10 @@ class ConsistencyMonitor:
                 design_nodes.append(node_info)  # Unknown goes to design
 
         # Sort all lists
-        design_nodes.sort(key=lambda x: x["id"])
-        feature_nodes.sort(key=lambda x: x["id"])
-        component_nodes.sort(key=lambda x: x["id"])
+        by_id = itemgetter("id")
+        design_nodes.sort(key=by_id)
+        feature_nodes.sort(key=by_id)
+        component_nodes.sort(key=by_id)
 
         # 4. Calculate statistics (including schema compliance)
         stats = self._calculate_stats(design_nodes, feature_nodes, component_nodes, schema_report)
@@ -322,7 +326,7 @@ class ConsistencyMonitor:
         assign_bar = self._make_progress_bar(stats['feature_assign_pct'])
         overall_bar = self._make_progress_bar(stats['overall_pct'])
 
-        content = f"""# DevSpec Product Dashboard
+        parts = [f"""# DevSpec Product Dashboard
 
 > **Generated At**: {timestamp}
 > **Phase**: 0 (Genesis Spec)
@@ -342,7 +346,7 @@ class ConsistencyMonitor:
 
 | File | Type | Status | Issues |
 | :--- | :--- | :--- | :--- |
-"""
+"""]
         for result in schema_report.results:
             status_icon = "Valid" if result.is_valid else "Invalid"
             status_emoji = "O" if result.is_valid else "X"
@@ -357,52 +361,59 @@ class ConsistencyMonitor:
                 issues.extend([f"[W] {w.field}: {w.message}" for w in result.warnings[:2]])
             issue_str = "; ".join(issues) if issues else "-"
 
-            content += f"| `{result.file_path}` | {result.node_type} | {status_emoji} {status_icon} | {issue_str} |\n"
+            parts.append(f"| `{result.file_path}` | {result.node_type} | {status_emoji} {status_icon} | {issue_str} |\n")
 
-        content += f"""
+        parts.append("""
 ---
 
 ## System Design (Domain & Design)
 
 | Node ID | Type | Spec Status |
 | :--- | :--- | :--- |
-"""
-        for item in design_nodes:
-            spec_icon = "O" if item['spec_synced'] else "!" if "PRD" in item['spec_status'] else "X"
-            content += f"| `{item['id']}` | {item['type']} | {spec_icon} {item['spec_status']} |\n"
+""")
+        parts.extend(
+            f"| `{item['id']}` | {item['type']} | {self._spec_icon(item)} {item['spec_status']} |\n"
+            for item in design_nodes
+        )
 
-        content += f"""
+        parts.append("""
 ---
 
 ## Features
 
 | Node ID | Domain | Spec Status | Assignment Status |
 | :--- | :--- | :--- | :--- |
-"""
+""")
         for item in feature_nodes:
-            spec_icon = "O" if item['spec_synced'] else "!" if "PRD" in item['spec_status'] else "X"
             assign_icon = "O" if item['assignment_count'] > 0 else "X"
-            content += f"| `{item['id']}` | {item['domain']} | {spec_icon} {item['spec_status']} | {assign_icon} {item['assignment_status']} |\n"
+            parts.append(f"| `{item['id']}` | {item['domain']} | {self._spec_icon(item)} {item['spec_status']} | {assign_icon} {item['assignment_status']} |\n")
 
-        content += f"""
+        parts.append("""
 ---
 
 ## Components
 
 | Node ID | Parent Feature | Spec Status |
 | :--- | :--- | :--- |
-"""
-        for item in component_nodes:
-            spec_icon = "O" if item['spec_synced'] else "!" if "PRD" in item['spec_status'] else "X"
-            content += f"| `{item['id']}` | {item['parent_features']} | {spec_icon} {item['spec_status']} |\n"
+""")
+        parts.extend(
+            f"| `{item['id']}` | {item['parent_features']} | {self._spec_icon(item)} {item['spec_status']} |\n"
+            for item in component_nodes
+        )
 
-        content += "\n---\n*Auto-generated by DevSpec Consistency Monitor*\n"
+        parts.append("\n---\n*Auto-generated by DevSpec Consistency Monitor*\n")
 
+        # Join once instead of re-copying the growing string per row
         with open(output_path, 'w', encoding='utf-8') as f:
-            f.write(content)
+            f.write("".join(parts))
 
         self.console.print(f"\n[green]Dashboard updated: {output_path}[/green]")
 
+    @staticmethod
+    def _spec_icon(item: Dict) -> str:
+        """Dashboard status icon for a node's spec sync state."""
+        return "O" if item['spec_synced'] else "!" if "PRD" in item['spec_status'] else "X"
+
     def _make_progress_bar(self, percentage: int) -> str:
         """Create a text progress bar."""
         filled = int(percentage / 5)
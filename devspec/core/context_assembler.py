@@ -8,9 +8,11 @@ Component: comp_context_assembler
 Feature: feat_context_assembler
 """
 
-from typing import Optional, List
+from operator import attrgetter
+from typing import Optional, List, Dict, Any
 import yaml
 
+from devspec.core._yaml_cache import parse_yaml
 from devspec.core.graph_query import GraphQuery, FeatureContext, ComponentContext
 from devspec.core.graph_database import NodeModel
 
@@ -21,6 +23,9 @@ from devspec.core.graph_database import NodeModel
 
 PHASES = ["understanding", "locating", "evaluating", "planning", "coding"]
 
+# Sort key for nodes, ordered by ID
+BY_ID = attrgetter("id")
+
 
 # =============================================================================
 # Context Assembler
@@ -42,6 +47,8 @@ class ContextAssembler:
             graph_query: GraphQuery instance for database queries
         """
         self.graph_query = graph_query
+        # raw_yaml text -> parsed data (None if unparsable); treat as read-only
+        self._parsed_yaml: Dict[str, Any] = {}
 
     def assemble(self, phase: str, focus_node_id: Optional[str] = None) -> str:
         """
@@ -95,15 +102,11 @@ class ContextAssembler:
         vision = ""
         description = product.description or ""
 
-        if product.raw_yaml:
-            try:
-                data = yaml.safe_load(product.raw_yaml)
-                if isinstance(data, dict):
-                    vision = data.get("vision", "")
-                    if not description:
-                        description = data.get("description", "")
-            except yaml.YAMLError:
-                pass
+        data = self._parse_raw_yaml(product.raw_yaml)
+        if isinstance(data, dict):
+            vision = data.get("vision", "")
+            if not description:
+                description = data.get("description", "")
 
         lines = [
             "# Product Context",
@@ -145,8 +148,9 @@ class ContextAssembler:
             return "# Domain Overview\n\n*No domains defined.*\n"
 
         lines = ["# Domain Overview", ""]
+        features_by_domain = self.graph_query.get_features_grouped_by_domain()
 
-        for domain in sorted(domains, key=lambda d: d.id):
+        for domain in sorted(domains, key=BY_ID):
             lines.append(f"## {domain.name or domain.id} (`{domain.id}`)")
             lines.append("")
 
@@ -155,12 +159,12 @@ class ContextAssembler:
                 lines.append("")
 
             # Get features for this domain
-            features = self.graph_query.get_features_by_domain(domain.id)
+            features = features_by_domain.get(domain.id, [])
 
             if features:
                 lines.append("**Features**:")
                 lines.append("")
-                for feat in sorted(features, key=lambda f: f.id):
+                for feat in sorted(features, key=BY_ID):
                     intent = self._get_intent(feat)
                     lines.append(f"- `{feat.id}`: {intent}")
                 lines.append("")
@@ -251,7 +255,7 @@ class ContextAssembler:
         lines.append("")
 
         if context.components:
-            for comp in sorted(context.components, key=lambda c: c.id):
+            for comp in sorted(context.components, key=BY_ID):
                 lines.append(f"### `{comp.id}`")
                 lines.append("")
                 lines.append(f"**Description**: {comp.description or 'N/A'}")
@@ -479,7 +483,7 @@ class ContextAssembler:
         lines.append("")
 
         if substrates:
-            for sub in sorted(substrates, key=lambda s: s.id):
+            for sub in sorted(substrates, key=BY_ID):
                 lines.append(f"### `{sub.id}`: {sub.name or 'N/A'}")
                 lines.append("")
 
@@ -488,28 +492,24 @@ class ContextAssembler:
                     lines.append("")
 
                 # Extract key content from raw_yaml
-                if sub.raw_yaml:
-                    try:
-                        data = yaml.safe_load(sub.raw_yaml)
-                        if isinstance(data, dict):
-                            # Show relevant fields
-                            for key in ["principles", "rules", "stack", "conventions"]:
-                                if key in data:
-                                    lines.append(f"**{key.title()}**:")
-                                    lines.append("")
-                                    value = data[key]
-                                    if isinstance(value, list):
-                                        for item in value:
-                                            if isinstance(item, dict):
-                                                name = item.get("name", item.get("id", str(item)))
-                                                lines.append(f"- {name}")
-                                            else:
-                                                lines.append(f"- {item}")
+                data = self._parse_raw_yaml(sub.raw_yaml)
+                if isinstance(data, dict):
+                    # Show relevant fields
+                    for key in ["principles", "rules", "stack", "conventions"]:
+                        if key in data:
+                            lines.append(f"**{key.title()}**:")
+                            lines.append("")
+                            value = data[key]
+                            if isinstance(value, list):
+                                for item in value:
+                                    if isinstance(item, dict):
+                                        name = item.get("name", item.get("id", str(item)))
+                                        lines.append(f"- {name}")
                                     else:
-                                        lines.append(str(value))
-                                    lines.append("")
-                    except yaml.YAMLError:
-                        pass
+                                        lines.append(f"- {item}")
+                            else:
+                                lines.append(str(value))
+                            lines.append("")
         else:
             lines.append("*No substrate constraints defined.*")
             lines.append("")
@@ -520,30 +520,41 @@ class ContextAssembler:
     # Helper Methods
     # -------------------------------------------------------------------------
 
+    def _parse_raw_yaml(self, raw_yaml: Optional[str]) -> Any:
+        """
+        Parse a node's raw_yaml, memoized by its text.
+
+        Several sections read fields from the same node's YAML while one
+        context is assembled; each distinct text is parsed only once.
+
+        Returns:
+            Parsed data, or None if raw_yaml is empty or invalid
+        """
+        if not raw_yaml:
+            return None
+        if raw_yaml not in self._parsed_yaml:
+            try:
+                self._parsed_yaml[raw_yaml] = parse_yaml(raw_yaml)
+            except yaml.YAMLError:
+                self._parsed_yaml[raw_yaml] = None
+        return self._parsed_yaml[raw_yaml]
+
     def _get_intent(self, node: NodeModel) -> str:
         """Extract intent from node's raw_yaml."""
         if node.intent:
             return node.intent
 
-        if node.raw_yaml:
-            try:
-                data = yaml.safe_load(node.raw_yaml)
-                if isinstance(data, dict):
-                    return data.get("intent", "")
-            except yaml.YAMLError:
-                pass
+        data = self._parse_raw_yaml(node.raw_yaml)
+        if isinstance(data, dict):
+            return data.get("intent", "")
 
         return ""
 
     def _get_user_stories(self, node: NodeModel) -> List[str]:
         """Extract user_stories from node's raw_yaml."""
-        if node.raw_yaml:
-            try:
-                data = yaml.safe_load(node.raw_yaml)
-                if isinstance(data, dict):
-                    stories = data.get("user_stories", [])
-                    if isinstance(stories, list):
-                        return stories
-            except yaml.YAMLError:
-                pass
+        data = self._parse_raw_yaml(node.raw_yaml)
+        if isinstance(data, dict):
+            stories = data.get("user_stories", [])
+            if isinstance(stories, list):
+                return stories
         return []
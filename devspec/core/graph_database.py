@@ -8,10 +8,12 @@ Component: comp_graph_database
 Feature: feat_specgraph_database
 """
 
+from contextlib import contextmanager
 from datetime import datetime
 from pathlib import Path
-from typing import Optional, List
+from typing import Dict, Iterable, Iterator, Optional, List, Tuple
 
+from sqlalchemy import Connection, Index, delete, event, insert
 from sqlmodel import SQLModel, Field, Session, create_engine, select
 
 
@@ -21,6 +23,16 @@ from sqlmodel import SQLModel, Field, Session, create_engine, select
 
 DEFAULT_DB_PATH = ".specgraph/.runtime/specgraph.db"
 
+# Applied to every new SQLite connection: WAL lets readers (e.g. specview)
+# run alongside a sync, and NORMAL sync is durable enough under WAL
+SQLITE_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-65536",
+    "PRAGMA mmap_size=268435456",
+)
+
 RELATION_TYPES = [
     "contains",      # Product -> Domain
     "owns",          # Domain -> Feature (via Feature.domain field)
@@ -33,6 +45,26 @@ RELATION_TYPES = [
 ]
 
 
+# =============================================================================
+# Helper Functions
+# =============================================================================
+
+def _apply_sqlite_pragmas(dbapi_connection, connection_record) -> None:
+    """Engine connect hook: apply SQLITE_PRAGMAS to a new connection."""
+    # Let SQLAlchemy emit BEGIN (see _emit_begin) instead of the sqlite3
+    # driver, whose implicit transactions break SAVEPOINT nesting
+    dbapi_connection.isolation_level = None
+    cursor = dbapi_connection.cursor()
+    for pragma in SQLITE_PRAGMAS:
+        cursor.execute(pragma)
+    cursor.close()
+
+
+def _emit_begin(conn) -> None:
+    """Engine begin hook: start the transaction explicitly."""
+    conn.exec_driver_sql("BEGIN")
+
+
 # =============================================================================
 # Data Models
 # =============================================================================
@@ -60,6 +92,9 @@ class EdgeModel(SQLModel, table=True):
     """SQLModel for edges table."""
 
     __tablename__ = "edges"
+    # Domain -> feature ("owns") and feature -> component ("realized_by") lookups
+    # filter on relation + source_id; this index also covers per-source counts
+    __table_args__ = (Index("ix_edges_relation_source", "relation", "source_id"),)
 
     id: Optional[int] = Field(default=None, primary_key=True, description="Auto-increment primary key")
     source_id: str = Field(index=True, description="Source node ID")
@@ -81,6 +116,16 @@ class DomainAPIModel(SQLModel, table=True):
     description: Optional[str] = Field(default=None, description="API description")
 
 
+class SyncStateModel(SQLModel, table=True):
+    """SQLModel for sync_state table: the files the last full sync was built from."""
+
+    __tablename__ = "sync_state"
+
+    source_file: str = Field(primary_key=True, description="Source YAML file path")
+    content_hash: str = Field(description="Hash of the file's YAML content")
+    error: Optional[str] = Field(default=None, description="Why the file was rejected, if it was")
+
+
 # =============================================================================
 # Database Manager
 # =============================================================================
@@ -106,10 +151,58 @@ class GraphDatabase:
 
         # Create SQLite engine
         self.engine = create_engine(f"sqlite:///{self.db_path}")
+        event.listen(self.engine, "connect", _apply_sqlite_pragmas)
+        event.listen(self.engine, "begin", _emit_begin)
+
+        # Connection holding the open transaction while inside bulk_write()
+        self._bulk_conn: Optional[Connection] = None
+
+        # Incremented on every write; lets readers detect stale in-memory copies
+        self.write_version = 0
+
+    @contextmanager
+    def bulk_write(self) -> Iterator[None]:
+        """
+        Run all writes made inside the block as one transaction, without fsync.
+
+        Used by full sync: the database is rebuilt from the YAML files, so a
+        crash mid-sync loses nothing that a re-sync would not restore. Each
+        write method commits to a savepoint instead, so a failed write still
+        rolls back on its own; everything is committed once when the block
+        exits, or rolled back if it raises.
+        """
+        with self.engine.connect() as conn:
+            # PRAGMA synchronous cannot change inside a transaction, so set it
+            # through the driver (which does not autobegin) before BEGIN and
+            # restore it after COMMIT, before the connection returns to the pool
+            driver_conn = conn.connection.driver_connection
+            driver_conn.execute("PRAGMA synchronous=OFF")
+            try:
+                with conn.begin():
+                    self._bulk_conn = conn
+                    yield
+            finally:
+                self._bulk_conn = None
+                driver_conn.execute("PRAGMA synchronous=NORMAL")
+
+    @contextmanager
+    def _begin(self) -> Iterator[Connection]:
+        """Begin a Core transaction (a savepoint inside bulk_write())."""
+        if self._bulk_conn is not None:
+            with self._bulk_conn.begin_nested():
+                yield self._bulk_conn
+        else:
+            with self.engine.begin() as conn:
+                yield conn
 
     def create_tables(self) -> None:
-        """Create all required tables if they don't exist."""
+        """Create all required tables and indexes if they don't exist."""
         SQLModel.metadata.create_all(self.engine)
+        # create_all skips tables that already exist, so add indexes introduced
+        # after an existing database was created
+        for table in SQLModel.metadata.sorted_tables:
+            for index in table.indexes:
+                index.create(self.engine, checkfirst=True)
 
     def close(self) -> None:
         """Close the database connection and dispose of the engine."""
@@ -119,9 +212,14 @@ class GraphDatabase:
         """
         Get a database session for transactions.
 
+        Inside bulk_write() the session joins the open transaction and its
+        commit() only releases a savepoint.
+
         Returns:
             SQLModel Session object
         """
+        if self._bulk_conn is not None:
+            return Session(bind=self._bulk_conn, join_transaction_mode="create_savepoint")
         return Session(self.engine)
 
     def upsert_node(self, node: NodeModel) -> None:
@@ -136,6 +234,34 @@ class GraphDatabase:
             node.updated_at = datetime.utcnow()
             session.merge(node)
             session.commit()
+        self.write_version += 1
+
+    def upsert_nodes(self, nodes: List[NodeModel]) -> None:
+        """
+        Insert or replace many nodes with one executemany statement.
+
+        Bypasses the ORM unit of work. Rows are written in order, so a later
+        node with the same ID replaces an earlier one, as with repeated
+        upsert_node() calls. Runs in a single transaction: if any row fails,
+        nothing is written and the error propagates.
+
+        Args:
+            nodes: NodeModels to upsert
+        """
+        if not nodes:
+            return
+
+        now = datetime.utcnow()
+        columns = [column.name for column in NodeModel.__table__.columns]
+        rows = []
+        for node in nodes:
+            node.updated_at = now
+            rows.append({name: getattr(node, name) for name in columns})
+
+        statement = insert(NodeModel.__table__).prefix_with("OR REPLACE")
+        with self._begin() as conn:
+            conn.execute(statement, rows)
+        self.write_version += 1
 
     def upsert_edge(self, edge: EdgeModel) -> None:
         """
@@ -162,6 +288,42 @@ class GraphDatabase:
                 session.add(edge)
 
             session.commit()
+        self.write_version += 1
+
+    def upsert_edges(self, edges: List[EdgeModel]) -> None:
+        """
+        Insert or update many edges in a single session and transaction.
+
+        Equivalent to calling upsert_edge() for each edge in order, but the
+        existing edges are loaded with one query and matched in memory
+        instead of issuing one SELECT (and one commit) per edge.
+
+        Args:
+            edges: EdgeModels to upsert
+        """
+        if not edges:
+            return
+
+        with self.get_session() as session:
+            existing = {
+                (e.source_id, e.target_id, e.relation): e
+                for e in session.exec(select(EdgeModel)).all()
+            }
+
+            for edge in edges:
+                key = (edge.source_id, edge.target_id, edge.relation)
+                current = existing.get(key)
+                if current is not None:
+                    # Update metadata if edge exists
+                    current.edge_metadata = edge.edge_metadata
+                    session.add(current)
+                else:
+                    # Insert new edge
+                    session.add(edge)
+                    existing[key] = edge
+
+            session.commit()
+        self.write_version += 1
 
     def delete_node(self, node_id: str) -> None:
         """
@@ -185,6 +347,7 @@ class GraphDatabase:
                 session.delete(node)
 
             session.commit()
+        self.write_version += 1
 
     def get_node(self, node_id: str) -> Optional[NodeModel]:
         """
@@ -210,6 +373,43 @@ class GraphDatabase:
             statement = select(NodeModel)
             return list(session.exec(statement).all())
 
+    def get_sync_state(self) -> Dict[str, Tuple[str, Optional[str]]]:
+        """
+        Get the files recorded by the last completed full sync.
+
+        Returns:
+            {source_file: (content_hash, error)}; empty if no full sync has
+            completed since the last single-file sync
+        """
+        with self.get_session() as session:
+            statement = select(
+                SyncStateModel.source_file,
+                SyncStateModel.content_hash,
+                SyncStateModel.error,
+            )
+            return {
+                source_file: (content_hash, error)
+                for source_file, content_hash, error in session.exec(statement).all()
+            }
+
+    def set_sync_state(self, files: Iterable[Tuple[str, str, Optional[str]]]) -> None:
+        """
+        Replace the recorded full-sync state.
+
+        Args:
+            files: (source_file, content_hash, error) for every file the full
+                   sync read; pass nothing to clear the record
+        """
+        rows = [
+            {"source_file": source_file, "content_hash": content_hash, "error": error}
+            for source_file, content_hash, error in files
+        ]
+        with self._begin() as conn:
+            conn.execute(delete(SyncStateModel.__table__))
+            if rows:
+                conn.execute(insert(SyncStateModel.__table__), rows)
+        self.write_version += 1
+
     def get_all_edges(self) -> List[EdgeModel]:
         """
         Retrieve all edges from database.
@@ -244,6 +444,7 @@ class GraphDatabase:
                 session.add(api)
 
             session.commit()
+        self.write_version += 1
 
     def delete_domain_apis(self, domain_id: str) -> None:
         """
@@ -260,6 +461,7 @@ class GraphDatabase:
             for api in apis:
                 session.delete(api)
             session.commit()
+        self.write_version += 1
 
     def get_domain_apis(self, domain_id: str) -> List[DomainAPIModel]:
         """
@@ -279,11 +481,17 @@ class GraphDatabase:
 
     def clear_all(self) -> None:
         """
-        Clear all data from the database (nodes, edges, and domain_apis).
+        Clear all data from the database (nodes, edges, domain_apis and
+        sync_state).
 
         Used for full synchronization to start fresh.
         """
         with self.get_session() as session:
+            # Delete the recorded full-sync state
+            states = session.exec(select(SyncStateModel)).all()
+            for state in states:
+                session.delete(state)
+
             # Delete all edges
             edges = session.exec(select(EdgeModel)).all()
             for edge in edges:
@@ -300,3 +508,4 @@ class GraphDatabase:
                 session.delete(node)
 
             session.commit()
+        self.write_version += 1
@@ -10,11 +10,14 @@ Feature: feat_specgraph_database
 
 from collections import deque
 from dataclasses import dataclass, field
-from typing import List, Dict, Optional, Any
+from itertools import groupby
+from operator import itemgetter
+from typing import List, Dict, Optional, Any, Tuple
 
 import yaml
-from sqlmodel import select
+from sqlmodel import and_, or_, select
 
+from devspec.core._yaml_cache import parse_yaml
 from devspec.core.graph_database import (
     GraphDatabase,
     NodeModel,
@@ -23,6 +26,14 @@ from devspec.core.graph_database import (
 )
 
 
+# =============================================================================
+# Constants
+# =============================================================================
+
+# Number of landmark BFS roots computed per snapshot for find_path pruning
+LANDMARK_COUNT = 3
+
+
 # =============================================================================
 # Data Classes
 # =============================================================================
@@ -58,6 +69,20 @@ class ComponentContext:
     design: Dict[str, Any] = field(default_factory=dict)
 
 
+@dataclass
+class GraphSnapshot:
+    """In-memory adjacency-list copy of the graph for repeated traversals."""
+
+    version: int
+    nodes: Dict[str, NodeModel] = field(default_factory=dict)
+    adj_out: Dict[str, List[Tuple[str, EdgeModel]]] = field(default_factory=dict)
+    adj_in: Dict[str, List[Tuple[str, EdgeModel]]] = field(default_factory=dict)
+    # node_id -> connected component index (edges treated as undirected)
+    components: Dict[str, int] = field(default_factory=dict)
+    # Undirected hop distances from a few landmark nodes, for path bounds
+    landmarks: List[Dict[str, int]] = field(default_factory=list)
+
+
 # =============================================================================
 # Graph Query Engine
 # =============================================================================
@@ -73,6 +98,35 @@ class GraphQuery:
             db: GraphDatabase instance
         """
         self.db = db
+        self._snapshot: Optional[GraphSnapshot] = None
+
+    def snapshot(self) -> GraphSnapshot:
+        """
+        Load all nodes and edges into memory for in-process traversal.
+
+        While the snapshot is fresh (no writes through ``self.db`` since it
+        was taken), get_children, get_parents, get_node_with_relations and
+        find_path read from it instead of issuing SQL per hop.
+
+        Returns:
+            The newly built GraphSnapshot
+        """
+        with self.db.get_session() as session:
+            nodes = session.exec(select(NodeModel)).all()
+            edges = session.exec(select(EdgeModel).order_by(EdgeModel.id)).all()
+
+        snap = GraphSnapshot(
+            version=self.db.write_version,
+            nodes={node.id: node for node in nodes},
+        )
+        for edge in edges:
+            snap.adj_out.setdefault(edge.source_id, []).append((edge.target_id, edge))
+            snap.adj_in.setdefault(edge.target_id, []).append((edge.source_id, edge))
+
+        self._index_snapshot_distances(snap)
+
+        self._snapshot = snap
+        return snap
 
     def get_nodes_by_type(self, node_type: str) -> List[NodeModel]:
         """
@@ -99,6 +153,10 @@ class GraphQuery:
         Returns:
             NodeGraph with root node and related nodes/edges, or None if not found
         """
+        snap = self._get_snapshot()
+        if snap is not None:
+            return self._get_node_with_relations_in_memory(snap, node_id, depth)
+
         root = self.db.get_node(node_id)
         if not root:
             return None
@@ -166,6 +224,14 @@ class GraphQuery:
         Returns:
             List of child nodes
         """
+        snap = self._get_snapshot()
+        if snap is not None:
+            return [
+                snap.nodes[target_id]
+                for target_id, edge in snap.adj_out.get(node_id, [])
+                if (not relation or edge.relation == relation) and target_id in snap.nodes
+            ]
+
         with self.db.get_session() as session:
             statement = select(EdgeModel).where(EdgeModel.source_id == node_id)
             if relation:
@@ -192,6 +258,14 @@ class GraphQuery:
         Returns:
             List of parent nodes
         """
+        snap = self._get_snapshot()
+        if snap is not None:
+            return [
+                snap.nodes[source_id]
+                for source_id, edge in snap.adj_in.get(node_id, [])
+                if (not relation or edge.relation == relation) and source_id in snap.nodes
+            ]
+
         with self.db.get_session() as session:
             statement = select(EdgeModel).where(EdgeModel.target_id == node_id)
             if relation:
@@ -215,22 +289,49 @@ class GraphQuery:
         Returns:
             FeatureContext or None if feature not found
         """
-        feature = self.db.get_node(feature_id)
+        with self.db.get_session() as session:
+            # One SELECT for every edge touching the feature (both directions)
+            edges = session.exec(
+                select(EdgeModel)
+                .where(
+                    or_(
+                        EdgeModel.source_id == feature_id,
+                        EdgeModel.target_id == feature_id,
+                    )
+                )
+                .order_by(EdgeModel.id)
+            ).all()
+
+            # One SELECT for the feature plus every node on the other end
+            need_ids = {feature_id}
+            for edge in edges:
+                need_ids.add(edge.source_id)
+                need_ids.add(edge.target_id)
+            nodes_by_id = self._get_nodes_by_ids(session, need_ids)
+
+        feature = nodes_by_id.get(feature_id)
         if not feature:
             return None
 
         context = FeatureContext(feature=feature)
 
-        # Get parent domain (owns relationship)
-        domains = self.get_parents(feature_id, "owns")
-        if domains:
-            context.domain = domains[0]
+        for edge in edges:
+            if edge.target_id == feature_id:
+                # Get parent domain (owns relationship)
+                if edge.relation == "owns" and context.domain is None:
+                    context.domain = nodes_by_id.get(edge.source_id)
+                continue
 
-        # Get implementing components (realized_by)
-        context.components = self.get_children(feature_id, "realized_by")
+            node = nodes_by_id.get(edge.target_id)
+            if not node:
+                continue
 
-        # Get dependent features (depends_on)
-        context.dependencies = self.get_children(feature_id, "depends_on")
+            if edge.relation == "realized_by":
+                # Implementing components
+                context.components.append(node)
+            elif edge.relation == "depends_on":
+                # Dependent features
+                context.dependencies.append(node)
 
         # Get consumed APIs (consumes)
         # Note: This would require a consumes relationship to be set up
@@ -248,29 +349,86 @@ class GraphQuery:
         Returns:
             ComponentContext or None if component not found
         """
-        component = self.db.get_node(component_id)
+        with self.db.get_session() as session:
+            # Features realizing this component, as a subquery
+            realizing_features = select(EdgeModel.source_id).where(
+                EdgeModel.target_id == component_id,
+                EdgeModel.relation == "realized_by",
+            )
+
+            # One SELECT for the component's own edges plus the "owns" edges
+            # from the domains of its parent features
+            all_edges = session.exec(
+                select(EdgeModel)
+                .where(
+                    or_(
+                        EdgeModel.source_id == component_id,
+                        EdgeModel.target_id == component_id,
+                        and_(
+                            EdgeModel.relation == "owns",
+                            EdgeModel.target_id.in_(realizing_features),
+                        ),
+                    )
+                )
+                .order_by(EdgeModel.id)
+            ).all()
+
+            edges = [
+                edge for edge in all_edges
+                if edge.source_id == component_id or edge.target_id == component_id
+            ]
+
+            # Parent features (realized_by relationship - we're the target)
+            feature_ids = [
+                edge.source_id
+                for edge in edges
+                if edge.target_id == component_id and edge.relation == "realized_by"
+            ]
+
+            # Domains owning those features
+            feature_id_set = set(feature_ids)
+            domain_edges = [
+                edge for edge in all_edges
+                if edge.relation == "owns" and edge.target_id in feature_id_set
+            ]
+
+            # One SELECT for the component plus every node on the other end
+            need_ids = {component_id}
+            for edge in all_edges:
+                need_ids.add(edge.source_id)
+                need_ids.add(edge.target_id)
+            nodes_by_id = self._get_nodes_by_ids(session, need_ids)
+
+        component = nodes_by_id.get(component_id)
         if not component:
             return None
 
         context = ComponentContext(component=component)
 
-        # Get parent feature (realized_by relationship - we're the target)
-        features = self.get_parents(component_id, "realized_by")
-        if features:
-            context.feature = features[0]
+        # Get parent feature (first one that resolves to a node)
+        for feature_id in feature_ids:
+            if feature_id in nodes_by_id:
+                context.feature = nodes_by_id[feature_id]
+                break
 
+        if context.feature:
             # Get parent domain through feature
-            domains = self.get_parents(context.feature.id, "owns")
-            if domains:
-                context.domain = domains[0]
+            for edge in domain_edges:
+                if edge.target_id == context.feature.id and edge.source_id in nodes_by_id:
+                    context.domain = nodes_by_id[edge.source_id]
+                    break
 
         # Get dependent components
-        context.dependencies = self.get_children(component_id, "depends_on")
+        for edge in edges:
+            if edge.source_id == component_id and edge.relation == "depends_on":
+                node = nodes_by_id.get(edge.target_id)
+                if node:
+                    context.dependencies.append(node)
 
         # Parse design from raw_yaml
         if component.raw_yaml:
             try:
-                data = yaml.safe_load(component.raw_yaml)
+                data = parse_yaml(component.raw_yaml)
                 if isinstance(data, dict) and "design" in data:
                     context.design = data["design"]
             except yaml.YAMLError:
@@ -306,6 +464,10 @@ class GraphQuery:
         if from_id == to_id:
             return []
 
+        snap = self._get_snapshot()
+        if snap is not None:
+            return self._find_path_in_memory(snap, from_id, to_id)
+
         # BFS to find shortest path
         visited = {from_id}
         queue = deque([(from_id, [])])  # (node_id, path_edges)
@@ -379,6 +541,39 @@ class GraphQuery:
         """
         return self.get_children(domain_id, "owns")
 
+    def get_features_grouped_by_domain(self) -> Dict[str, List[NodeModel]]:
+        """
+        Get the features of every domain in a single query.
+
+        Equivalent to calling get_features_by_domain for each domain, without
+        one round-trip per domain. Without a fresh snapshot, each domain's
+        features are returned in ID order.
+
+        Returns:
+            Dict mapping domain ID to its feature nodes
+        """
+        grouped: Dict[str, List[NodeModel]] = {}
+
+        snap = self._get_snapshot()
+        if snap is not None:
+            for source_id, out_edges in snap.adj_out.items():
+                for target_id, edge in out_edges:
+                    if edge.relation == "owns" and target_id in snap.nodes:
+                        grouped.setdefault(source_id, []).append(snap.nodes[target_id])
+            return grouped
+
+        # Ordered by domain, so each domain's rows arrive as one contiguous run
+        with self.db.get_session() as session:
+            statement = (
+                select(EdgeModel.source_id, NodeModel)
+                .join(NodeModel, NodeModel.id == EdgeModel.target_id)
+                .where(EdgeModel.relation == "owns")
+                .order_by(EdgeModel.source_id, NodeModel.id)
+            )
+            for domain_id, rows in groupby(session.exec(statement).all(), key=itemgetter(0)):
+                grouped[domain_id] = [node for _, node in rows]
+        return grouped
+
     def get_all_domains(self) -> List[NodeModel]:
         """
         Get all domain nodes.
@@ -405,3 +600,163 @@ class GraphQuery:
             List of component nodes
         """
         return self.get_nodes_by_type("component")
+
+    # =========================================================================
+    # Private Methods
+    # =========================================================================
+
+    def _get_snapshot(self) -> Optional[GraphSnapshot]:
+        """Return the snapshot if it is still current, dropping it otherwise."""
+        snap = self._snapshot
+        if snap is None:
+            return None
+        if snap.version != self.db.write_version:
+            self._snapshot = None
+            return None
+        return snap
+
+    def _get_node_with_relations_in_memory(
+        self, snap: GraphSnapshot, node_id: str, depth: int
+    ) -> Optional[NodeGraph]:
+        """Snapshot-backed implementation of get_node_with_relations."""
+        root = snap.nodes.get(node_id)
+        if not root:
+            return None
+
+        graph = NodeGraph(root=root)
+        graph.nodes[node_id] = root
+
+        visited = {node_id}
+        visited_edges: set[tuple[str, str, str]] = set()
+        queue = deque([(node_id, 0)])
+
+        while queue:
+            current_id, current_depth = queue.popleft()
+            if current_depth >= depth:
+                continue
+
+            for adjacency in (snap.adj_out, snap.adj_in):
+                for next_id, edge in adjacency.get(current_id, []):
+                    edge_key = (edge.source_id, edge.target_id, edge.relation)
+                    if edge_key not in visited_edges:
+                        visited_edges.add(edge_key)
+                        graph.edges.append(edge)
+                    if next_id not in visited:
+                        visited.add(next_id)
+                        next_node = snap.nodes.get(next_id)
+                        if next_node:
+                            graph.nodes[next_id] = next_node
+                            queue.append((next_id, current_depth + 1))
+
+        return graph
+
+    def _find_path_in_memory(
+        self, snap: GraphSnapshot, from_id: str, to_id: str
+    ) -> Optional[List[EdgeModel]]:
+        """
+        Snapshot-backed implementation of find_path.
+
+        Uses the snapshot's component labels to reject unreachable pairs
+        immediately, and landmark distances to skip neighbors that cannot lie
+        on a shortest path. Only provably useless nodes are pruned, so the
+        returned path is the same one a plain BFS would find.
+        """
+        component = snap.components.get(from_id)
+        if component is None or component != snap.components.get(to_id):
+            return None
+
+        # Landmarks sharing the component give both an upper bound on the
+        # path length (via the landmark) and a per-node lower bound.
+        bounds = [
+            (dist, dist[to_id])
+            for dist in snap.landmarks
+            if to_id in dist and from_id in dist
+        ]
+        best = min(
+            (dist[from_id] + to_dist for dist, to_dist in bounds),
+            default=float("inf"),
+        )
+
+        visited = {from_id}
+        queue = deque([(from_id, [])])
+
+        while queue:
+            current_id, path = queue.popleft()
+            next_depth = len(path) + 1
+
+            for adjacency in (snap.adj_out, snap.adj_in):
+                for next_id, edge in adjacency.get(current_id, []):
+                    if next_id == to_id:
+                        return path + [edge]
+
+                    if next_id in visited:
+                        continue
+
+                    lower_bound = max(
+                        (abs(dist[next_id] - to_dist) for dist, to_dist in bounds),
+                        default=0,
+                    )
+                    if next_depth + lower_bound > best:
+                        continue
+
+                    visited.add(next_id)
+                    queue.append((next_id, path + [edge]))
+
+        return None
+
+    def _index_snapshot_distances(self, snap: GraphSnapshot) -> None:
+        """Fill component labels and landmark distances for a snapshot."""
+        all_ids = set(snap.adj_out) | set(snap.adj_in)
+
+        component = 0
+        for node_id in sorted(all_ids):
+            if node_id not in snap.components:
+                for reached in self._bfs_distances(snap, node_id):
+                    snap.components[reached] = component
+                component += 1
+
+        # Highest-degree node first, then repeatedly the node farthest from
+        # every landmark chosen so far (farthest-point landmark selection).
+        if not all_ids:
+            return
+
+        def degree(node_id: str) -> int:
+            return len(snap.adj_out.get(node_id, [])) + len(snap.adj_in.get(node_id, []))
+
+        root = max(sorted(all_ids), key=degree)
+        for _ in range(LANDMARK_COUNT):
+            dist = self._bfs_distances(snap, root)
+            snap.landmarks.append(dist)
+
+            farthest = None
+            farthest_dist = 0
+            for node_id in sorted(dist):
+                nearest = min(d.get(node_id, 0) for d in snap.landmarks)
+                if nearest > farthest_dist:
+                    farthest, farthest_dist = node_id, nearest
+            if farthest is None:
+                break
+            root = farthest
+
+    def _bfs_distances(self, snap: GraphSnapshot, root: str) -> Dict[str, int]:
+        """Undirected hop distance from root to every reachable node."""
+        dist = {root: 0}
+        queue = deque([root])
+        while queue:
+            current_id = queue.popleft()
+            next_dist = dist[current_id] + 1
+            for adjacency in (snap.adj_out, snap.adj_in):
+                for next_id, _edge in adjacency.get(current_id, []):
+                    if next_id not in dist:
+                        dist[next_id] = next_dist
+                        queue.append(next_id)
+        return dist
+
+    def _get_nodes_by_ids(self, session, node_ids) -> Dict[str, NodeModel]:
+        """Fetch several nodes in a single SELECT, keyed by node ID."""
+        if not node_ids:
+            return {}
+        nodes = session.exec(
+            select(NodeModel).where(NodeModel.id.in_(list(node_ids)))
+        ).all()
+        return {node.id: node for node in nodes}
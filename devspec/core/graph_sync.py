@@ -7,26 +7,38 @@ Component: comp_graph_sync
 Feature: feat_specgraph_database
 """
 
+import hashlib
+import os
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
 
 import yaml
+from sqlalchemy.exc import SQLAlchemyError
 
+from devspec.core._tree import scan_specgraph
+from devspec.core._yaml_cache import parse_yaml
 from devspec.core.graph_database import (
     GraphDatabase,
     NodeModel,
     EdgeModel,
     DomainAPIModel,
 )
+from devspec.infra.logger import get_logger
 
 
 # =============================================================================
 # Constants
 # =============================================================================
 
+logger = get_logger(__name__)
+
 SKIP_DIRS = [".runtime", "__pycache__"]
 
+# Worker threads used to read and parse YAML files
+MAX_WORKERS = min(32, os.cpu_count() or 4)
+
 VALID_NODE_TYPES = [
     "product",
     "domain",
@@ -36,6 +48,31 @@ VALID_NODE_TYPES = [
     "substrate",
 ]
 
+# Node ID prefix (before the first "_") -> node type
+NODE_TYPE_BY_PREFIX = {
+    "prod": "product",
+    "dom": "domain",
+    "feat": "feature",
+    "comp": "component",
+    "des": "design",
+    "sub": "substrate",
+}
+
+
+# =============================================================================
+# Helper Functions
+# =============================================================================
+
+def _node_type_from_id(node_id: str) -> Optional[str]:
+    """Node type implied by the ID prefix, or None if it has no known prefix."""
+    prefix, sep, _ = node_id.partition("_")
+    return NODE_TYPE_BY_PREFIX.get(prefix) if sep else None
+
+
+def _content_hash(content: str) -> str:
+    """Stable hash of a YAML file's text, used to detect unchanged files."""
+    return hashlib.blake2b(content.encode("utf-8"), digest_size=16).hexdigest()
+
 
 # =============================================================================
 # Data Classes
@@ -49,6 +86,7 @@ class SyncResult:
     updated: int = 0
     deleted: int = 0
     edges_created: int = 0
+    unchanged: int = 0  # YAML files found unchanged (set only when the rebuild is skipped)
     errors: List[str] = field(default_factory=list)
 
 
@@ -71,12 +109,23 @@ class GraphSync:
         self.root_path = Path(root_path)
         self.spec_dir = self.root_path / ".specgraph"
 
-    def sync_all(self) -> SyncResult:
+    def sync_all(self, force: bool = False) -> SyncResult:
         """
         Full sync of all YAML files to database.
 
         This performs a complete synchronization by clearing all existing data
-        and rebuilding from YAML files.
+        and rebuilding from YAML files. Each full sync records the content hash
+        of every file it read, including files rejected as invalid (with their
+        error). If the current files match that record exactly, the rebuild is
+        skipped: result.unchanged is set and the recorded errors are reported
+        again.
+
+        The record is cleared by sync_file(), and not written when a node could
+        not be stored in the database, so those cases always rebuild. A file
+        that cannot be read at all also forces a rebuild on every run.
+
+        Args:
+            force: Rebuild even if no YAML file has changed
 
         Returns:
             SyncResult with sync statistics
@@ -88,35 +137,88 @@ class GraphSync:
             result.errors.append(f"Spec directory not found: {self.spec_dir}")
             return result
 
-        # 1. Clear all existing data (full sync)
-        self.db.clear_all()
-
-        # 2. Get all YAML files
+        # 1. Get all YAML files and read them (in parallel)
         yaml_files = self._get_yaml_files()
-
-        # 3. Sync each file
-        for file_path in yaml_files:
-            node_data, error = self._sync_yaml_file(file_path)
-            if error:
-                result.errors.append(error)
-            elif node_data:
-                nodes_dict[node_data["id"]] = node_data
-                result.added += 1
-
-        # 4. Extract virtual Domain nodes from product.yaml
-        product_path = self.spec_dir / "product.yaml"
-        if product_path.exists():
-            domain_nodes = self._extract_domain_nodes(product_path)
-            for domain_data in domain_nodes:
-                nodes_dict[domain_data["id"]] = domain_data
-                # Upsert domain node
-                node = self._dict_to_node(domain_data, str(product_path.relative_to(self.root_path)))
-                if node:
-                    self.db.upsert_node(node)
-
-        # 5. Build and sync edges
-        edges_created = self._build_and_sync_edges(nodes_dict)
-        result.edges_created = edges_created
+        with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+            read_files = list(executor.map(self._read_text_file, yaml_files))
+            file_hashes = self._hash_files(yaml_files, read_files)
+
+            # Nothing changed since the last full sync: the database is already current
+            if not force and file_hashes:
+                recorded = self.db.get_sync_state()
+                if self._matches_sync_state(file_hashes, recorded):
+                    result.unchanged = len(yaml_files)
+                    result.errors.extend(
+                        error for _, error in recorded.values() if error
+                    )
+                    return result
+
+            parsed_files = list(
+                executor.map(self._parse_yaml_text, yaml_files, read_files)
+            )
+
+        # Rebuildable from YAML, so skip fsync while writing
+        with self.db.bulk_write():
+            # 2. Clear all existing data (full sync)
+            self.db.clear_all()
+
+            # 3. Sync each file: write to the DB on this thread
+            built = [
+                self._build_yaml_node(file_path, parsed)
+                for file_path, parsed in zip(yaml_files, parsed_files)
+            ]
+            write_errors = self._write_nodes(
+                [(file_path, node) for file_path, (node, _, _) in zip(yaml_files, built) if node]
+            )
+            # Rejection messages by relative path, recorded with the sync state
+            rejected: Dict[str, str] = {}
+
+            for file_path, (_, node_data, error) in zip(yaml_files, built):
+                if error:
+                    rejected[str(file_path.relative_to(self.root_path))] = error
+                error = error or write_errors.get(file_path)
+                if error:
+                    result.errors.append(error)
+                elif node_data:
+                    nodes_dict[node_data["id"]] = node_data
+                    result.added += 1
+
+            # 4. Extract virtual Domain nodes from product.yaml (already parsed above)
+            product_path = self.spec_dir / "product.yaml"
+            product_data = next(
+                (data for file_path, (_, data, _) in zip(yaml_files, parsed_files)
+                 if file_path == product_path),
+                None,
+            )
+            domain_errors: Dict[Any, str] = {}
+            if product_data is not None:
+                domain_nodes = self._extract_domain_nodes(product_data)
+                staged_domains = []
+                for domain_data in domain_nodes:
+                    # Upsert domain node
+                    node = self._dict_to_node(domain_data, str(product_path.relative_to(self.root_path)))
+                    if node:
+                        staged_domains.append((f"{product_path}#{domain_data['id']}", node))
+                domain_errors = self._write_nodes(staged_domains)
+
+                for domain_data in domain_nodes:
+                    error = domain_errors.get(f"{product_path}#{domain_data['id']}")
+                    if error:
+                        result.errors.append(error)
+                    else:
+                        nodes_dict[domain_data["id"]] = domain_data
+
+            # 5. Build and sync edges
+            edges_created = self._build_and_sync_edges(nodes_dict)
+            result.edges_created = edges_created
+
+            # 6. Record what this rebuild reflects, unless a node failed to
+            #    store (clear_all() already removed the previous record)
+            if file_hashes and not write_errors and not domain_errors:
+                self.db.set_sync_state(
+                    (rel_path, content_hash, rejected.get(rel_path))
+                    for rel_path, content_hash in file_hashes.items()
+                )
 
         return result
 
@@ -131,6 +233,8 @@ class GraphSync:
             SyncResult for this file
         """
         result = SyncResult()
+        # Edges are not rebuilt here, so the next sync_all() must not skip
+        self.db.set_sync_state(())
         node_data, error = self._sync_yaml_file(file_path)
 
         if error:
@@ -146,17 +250,7 @@ class GraphSync:
 
     def _get_yaml_files(self) -> List[Path]:
         """Get all YAML files, excluding skip directories."""
-        yaml_files = []
-        for file_path in self.spec_dir.rglob("*.yaml"):
-            # Skip directories in SKIP_DIRS
-            skip = False
-            for skip_dir in SKIP_DIRS:
-                if skip_dir in file_path.parts:
-                    skip = True
-                    break
-            if not skip:
-                yaml_files.append(file_path)
-        return yaml_files
+        return scan_specgraph(self.spec_dir, excluded_dirs=frozenset(SKIP_DIRS))
 
     def _sync_yaml_file(
         self, file_path: Path
@@ -167,30 +261,166 @@ class GraphSync:
         Returns:
             (node_data, error_message)
         """
+        return self._apply_yaml_file(file_path, self._read_yaml_file(file_path))
+
+    def _read_yaml_file(
+        self, file_path: Path
+    ) -> Tuple[Optional[str], Any, Optional[str]]:
+        """
+        Read and parse a YAML file without touching the database.
+
+        Safe to run on a worker thread.
+
+        Returns:
+            (raw_content, parsed_data, error_message)
+        """
+        return self._parse_yaml_text(file_path, self._read_text_file(file_path))
+
+    def _read_text_file(self, file_path: Path) -> Tuple[Optional[str], Optional[str]]:
+        """
+        Read a YAML file as text. Safe to run on a worker thread.
+
+        Returns:
+            (raw_content, error_message)
+        """
+        try:
+            return file_path.read_text(encoding="utf-8"), None
+        except Exception as e:
+            return None, f"Error processing {file_path}: {e}"
+
+    def _parse_yaml_text(
+        self, file_path: Path, read: Tuple[Optional[str], Optional[str]]
+    ) -> Tuple[Optional[str], Any, Optional[str]]:
+        """
+        Parse text returned by _read_text_file. Safe to run on a worker thread.
+
+        Returns:
+            (raw_content, parsed_data, error_message)
+        """
+        content, error = read
+        if error:
+            return None, None, error
         try:
-            content = file_path.read_text(encoding="utf-8")
+            return content, parse_yaml(content), None
+        except yaml.YAMLError as e:
+            return None, None, f"YAML parse error in {file_path}: {e}"
+        except Exception as e:
+            return None, None, f"Error processing {file_path}: {e}"
 
-            # Parse YAML
-            data = yaml.safe_load(content)
+    def _hash_files(
+        self,
+        yaml_files: List[Path],
+        read_files: List[Tuple[Optional[str], Optional[str]]],
+    ) -> Optional[Dict[str, str]]:
+        """
+        Hash the text returned by _read_text_file for each file.
+
+        Returns:
+            {relative_path: content_hash}, or None if any file was unreadable
+        """
+        hashes = {}
+        for file_path, (content, error) in zip(yaml_files, read_files):
+            if error:
+                return None
+            hashes[str(file_path.relative_to(self.root_path))] = _content_hash(content)
+        return hashes
+
+    @staticmethod
+    def _matches_sync_state(
+        file_hashes: Dict[str, str],
+        recorded: Dict[str, Tuple[str, Optional[str]]],
+    ) -> bool:
+        """True if the recorded sync state covers exactly these files and hashes."""
+        return len(recorded) == len(file_hashes) and all(
+            rel_path in recorded and recorded[rel_path][0] == content_hash
+            for rel_path, content_hash in file_hashes.items()
+        )
+
+    def _apply_yaml_file(
+        self,
+        file_path: Path,
+        parsed: Tuple[Optional[str], Any, Optional[str]],
+    ) -> tuple[Optional[Dict[str, Any]], Optional[str]]:
+        """
+        Validate parsed YAML and upsert it as a node.
+
+        Returns:
+            (node_data, error_message)
+        """
+        node, data, error = self._build_yaml_node(file_path, parsed)
+        if error:
+            return None, error
+
+        try:
+            self.db.upsert_node(node)
+        except Exception as e:
+            return None, f"Error processing {file_path}: {e}"
+        return data, None
+
+    def _build_yaml_node(
+        self,
+        file_path: Path,
+        parsed: Tuple[Optional[str], Any, Optional[str]],
+    ) -> Tuple[Optional[NodeModel], Optional[Dict[str, Any]], Optional[str]]:
+        """
+        Validate parsed YAML and convert it to a NodeModel (no DB access).
+
+        Returns:
+            (node, node_data, error_message)
+        """
+        content, data, error = parsed
+        if error:
+            return None, None, error
+
+        try:
             if not isinstance(data, dict):
-                return None, f"Invalid YAML structure in {file_path}"
+                return None, None, f"Invalid YAML structure in {file_path}"
 
             if "id" not in data:
-                return None, f"Missing 'id' field in {file_path}"
+                return None, None, f"Missing 'id' field in {file_path}"
 
-            # Build and upsert node
             rel_path = str(file_path.relative_to(self.root_path))
             node = self._dict_to_node(data, rel_path, raw_yaml=content)
             if node:
-                self.db.upsert_node(node)
-                return data, None
+                return node, data, None
 
-            return None, f"Failed to create node from {file_path}"
+            return None, None, f"Failed to create node from {file_path}"
 
-        except yaml.YAMLError as e:
-            return None, f"YAML parse error in {file_path}: {e}"
         except Exception as e:
-            return None, f"Error processing {file_path}: {e}"
+            return None, None, f"Error processing {file_path}: {e}"
+
+    def _write_nodes(self, staged: List[Tuple[Any, NodeModel]]) -> Dict[Any, str]:
+        """
+        Write all staged nodes in one batch.
+
+        If the batch fails (e.g. a field holds a value SQLite cannot store),
+        the failure is logged and the nodes are written one by one so the
+        error is reported against the offending source only.
+
+        Args:
+            staged: (source, node) pairs; source is the file path, or
+                    "product.yaml#<domain_id>" for virtual domain nodes
+
+        Returns:
+            {source: error_message} for nodes that could not be written
+        """
+        try:
+            self.db.upsert_nodes([node for _, node in staged])
+            return {}
+        except SQLAlchemyError as e:
+            # Log the driver error only; str(e) would dump every row's parameters
+            logger.warning(
+                "Batched write of %d nodes failed, retrying one by one: %s",
+                len(staged), getattr(e, "orig", None) or e,
+            )
+
+        errors: Dict[Any, str] = {}
+        for source, node in staged:
+            try:
+                self.db.upsert_node(node)
+            except SQLAlchemyError as e:
+                errors[source] = f"Error processing {source}: {e}"
+        return errors
 
     def _dict_to_node(
         self,
@@ -205,19 +435,8 @@ class GraphSync:
 
         # Determine node type from id prefix (preferred) or explicit type field
         # ID prefix takes precedence because Component YAML uses type: module
-        if node_id.startswith("prod_"):
-            node_type = "product"
-        elif node_id.startswith("dom_"):
-            node_type = "domain"
-        elif node_id.startswith("feat_"):
-            node_type = "feature"
-        elif node_id.startswith("comp_"):
-            node_type = "component"
-        elif node_id.startswith("des_"):
-            node_type = "design"
-        elif node_id.startswith("sub_"):
-            node_type = "substrate"
-        else:
+        node_type = _node_type_from_id(node_id)
+        if node_type is None:
             # Fall back to explicit type field
             node_type = data.get("type", "unknown")
 
@@ -230,15 +449,14 @@ class GraphSync:
             source_anchor=data.get("source_anchor"),
             intent=data.get("intent"),
             file_path=data.get("file_path"),
+            content_hash=_content_hash(raw_yaml) if raw_yaml is not None else None,
             raw_yaml=raw_yaml,
         )
 
-    def _extract_domain_nodes(self, product_path: Path) -> List[Dict[str, Any]]:
-        """Extract virtual Domain nodes from product.yaml."""
+    def _extract_domain_nodes(self, data: Any) -> List[Dict[str, Any]]:
+        """Extract virtual Domain nodes from parsed product.yaml data."""
         domain_nodes = []
         try:
-            content = product_path.read_text(encoding="utf-8")
-            data = yaml.safe_load(content)
             if isinstance(data, dict) and "domains" in data:
                 for domain in data.get("domains", []):
                     if isinstance(domain, dict) and "id" in domain:
@@ -255,32 +473,17 @@ class GraphSync:
             pass
         return domain_nodes
 
-    def _get_node_type_from_id(self, node_id: str) -> str:
-        """Determine node type from ID prefix."""
-        if node_id.startswith("prod_"):
-            return "product"
-        elif node_id.startswith("dom_"):
-            return "domain"
-        elif node_id.startswith("feat_"):
-            return "feature"
-        elif node_id.startswith("comp_"):
-            return "component"
-        elif node_id.startswith("des_"):
-            return "design"
-        elif node_id.startswith("sub_"):
-            return "substrate"
-        return "unknown"
-
     def _build_and_sync_edges(self, nodes_dict: Dict[str, Dict[str, Any]]) -> int:
         """Build and sync all edges from node relationships."""
-        edges_created = 0
+        edges: List[EdgeModel] = []
 
         for node_id, node_data in nodes_dict.items():
-            # Determine node type from ID prefix (not from data dict)
-            node_type = self._get_node_type_from_id(node_id)
+            # Determine node type from ID prefix (not from data dict); each
+            # node matches at most one branch below
+            node_type = _node_type_from_id(node_id)
 
             # Product -> Domain (contains)
-            if node_type == "product" and "domains" in node_data:
+            if node_type == "product":
                 for domain in node_data.get("domains", []):
                     if isinstance(domain, dict) and "id" in domain:
                         edge = EdgeModel(
@@ -288,55 +491,49 @@ class GraphSync:
                             target_id=domain["id"],
                             relation="contains",
                         )
-                        self.db.upsert_edge(edge)
-                        edges_created += 1
-
-            # Feature -> Domain (owns, via Feature.domain field)
-            if node_type == "feature" and "domain" in node_data:
-                domain_id = node_data["domain"]
-                edge = EdgeModel(
-                    source_id=domain_id,
-                    target_id=node_id,
-                    relation="owns",
-                )
-                self.db.upsert_edge(edge)
-                edges_created += 1
+                        edges.append(edge)
 
-            # Feature -> Feature (depends_on)
-            if node_type == "feature" and "depends_on" in node_data:
+            elif node_type == "feature":
+                # Feature -> Domain (owns, via Feature.domain field)
+                if "domain" in node_data:
+                    domain_id = node_data["domain"]
+                    edge = EdgeModel(
+                        source_id=domain_id,
+                        target_id=node_id,
+                        relation="owns",
+                    )
+                    edges.append(edge)
+
+                # Feature -> Feature (depends_on)
                 for dep_id in node_data.get("depends_on", []):
                     edge = EdgeModel(
                         source_id=node_id,
                         target_id=dep_id,
                         relation="depends_on",
                     )
-                    self.db.upsert_edge(edge)
-                    edges_created += 1
+                    edges.append(edge)
 
-            # Feature -> Component (realized_by)
-            if node_type == "feature" and "realized_by" in node_data:
+                # Feature -> Component (realized_by)
                 for comp_id in node_data.get("realized_by", []):
                     edge = EdgeModel(
                         source_id=node_id,
                         target_id=comp_id,
                         relation="realized_by",
                     )
-                    self.db.upsert_edge(edge)
-                    edges_created += 1
+                    edges.append(edge)
 
             # Component -> Component (dependencies)
-            if node_type == "component" and "dependencies" in node_data:
+            elif node_type == "component":
                 for dep_id in node_data.get("dependencies", []):
                     edge = EdgeModel(
                         source_id=node_id,
                         target_id=dep_id,
                         relation="depends_on",
                     )
-                    self.db.upsert_edge(edge)
-                    edges_created += 1
+                    edges.append(edge)
 
             # Domain -> DomainAPI (exports)
-            if node_type == "domain" and "exports" in node_data:
+            elif node_type == "domain":
                 for api in node_data.get("exports", []):
                     if isinstance(api, dict):
                         api_model = DomainAPIModel(
@@ -347,4 +544,7 @@ class GraphSync:
                         )
                         self.db.upsert_domain_api(api_model)
 
-        return edges_created
+        # Write all edges in one transaction
+        self.db.upsert_edges(edges)
+
+        return len(edges)
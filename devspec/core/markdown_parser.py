@@ -32,25 +32,29 @@ class MarkdownParser:
         with open(full_path, 'r', encoding='utf-8') as f:
             lines = f.readlines()
 
+        search_anchor = self.ANCHOR_PATTERN.search
+        match_header = self.HEADER_PATTERN.match
+
         for i, line in enumerate(lines):
+            # Cheap substring pre-check keeps the regex off plain prose lines
+            if '<!--' not in line:
+                continue
+
             # Check for anchor
-            anchor_match = self.ANCHOR_PATTERN.search(line)
+            anchor_match = search_anchor(line)
             if anchor_match:
                 anchor_id = anchor_match.group(1)
                 
                 # Try to find the header title in the same line
                 # (Usually the anchor is at the end of the header)
-                header_match = self.HEADER_PATTERN.match(line)
+                header_match = match_header(line)
                 title = "Unknown Section"
                 if header_match:
                     # Remove the anchor from the title for display
                     raw_title = header_match.group(2)
                     title = self.ANCHOR_PATTERN.sub('', raw_title).strip()
                 
-                results[anchor_id] = SectionMeta(
-                    title=title,
-                    anchor_id=anchor_id,
-                    line_number=i + 1
-                )
+                # Positional construction skips NamedTuple keyword handling
+                results[anchor_id] = SectionMeta(title, anchor_id, i + 1)
 
         return results
@@ -8,11 +8,12 @@ PRD 格式校验核心逻辑，检查章节结构、锚点格式、命名规范
 基于 des_prompt_prd_writer.md 定义的规则。
 """
 import re
+import string
 from dataclasses import dataclass, field
 from pathlib import Path
 
 
-@dataclass
+@dataclass(slots=True)
 class ValidationResult:
     """校验结果数据类。"""
 
@@ -27,12 +28,22 @@ class PRDValidator:
     # 锚点匹配正则
     ANCHOR_PATTERN = re.compile(r"<!--\s*id:\s*(\w+)\s*-->")
 
+    # snake_case 允许的字符：translate 删除后为空串即合法
+    SNAKE_CASE_DELETE = str.maketrans(
+        "", "", string.ascii_lowercase + string.digits + "_"
+    )
+
     # 有效的锚点前缀
     VALID_PREFIXES = ("prod_", "des_", "dom_", "feat_", "comp_", "sub_")
 
     # 必需章节
     MANDATORY_SECTIONS = ("Product Vision", "Design Principles", "Domain:")
 
+    # 必需章节的组合正则（一次扫描找出全部章节）
+    MANDATORY_SECTIONS_PATTERN = re.compile(
+        "|".join(re.escape(section) for section in MANDATORY_SECTIONS)
+    )
+
     def __init__(self, prd_path: Path) -> None:
         """初始化 PRDValidator。
 
@@ -71,55 +82,94 @@ class PRDValidator:
                 warnings=[],
             )
 
-        # 执行各项检查
+        # 执行各项检查（标题层级警告排在锚点命名警告之后输出）
         self._check_mandatory_sections()
-        self._check_anchor_format()
+        heading_warnings = self._scan_lines()
         self._check_anchor_naming()
-        self._check_heading_hierarchy()
+        self.warnings.extend(heading_warnings)
 
+        # 每次 validate() 都会重新创建列表，直接交出即可，无需拷贝
         return ValidationResult(
-            is_valid=len(self.errors) == 0,
-            errors=self.errors.copy(),
-            warnings=self.warnings.copy(),
+            is_valid=not self.errors,
+            errors=self.errors,
+            warnings=self.warnings,
         )
 
     def _check_mandatory_sections(self) -> None:
         """检查必需章节是否存在。"""
+        found: set[str] = set()
+        for match in self.MANDATORY_SECTIONS_PATTERN.finditer(self.content):
+            found.add(match.group(0))
+            if len(found) == len(self.MANDATORY_SECTIONS):
+                return
+
         for section in self.MANDATORY_SECTIONS:
-            if section not in self.content:
+            if section not in found:
                 self.errors.append(f"Missing mandatory section: {section}")
 
-    def _check_anchor_format(self) -> None:
-        """检查锚点格式是否正确。"""
+    def _scan_lines(self) -> list[str]:
+        """单次遍历所有行，同时检查锚点格式与标题层级。
+
+        锚点格式的错误/警告直接写入 self.errors / self.warnings；
+        标题层级警告作为返回值，由调用方在命名检查之后追加，保持输出顺序。
+
+        Returns:
+            标题层级警告列表
+        """
+        heading_warnings: list[str] = []
+        h1_count = 0
+
         for line_num, line in enumerate(self.lines, start=1):
-            # 只检查行末尾的锚点（真正的锚点定义）
-            # 忽略代码块、示例文本中的锚点格式说明
             stripped = line.strip()
+            starts_hash = stripped.startswith("#")
 
-            # 跳过代码块内容和格式说明
-            if stripped.startswith("`") or ": `" in line:
-                continue
-
-            # 检查是否有锚点模式（在行末尾）
-            if stripped.endswith("-->"):
-                match = self.ANCHOR_PATTERN.search(line)
-                if not match:
+            # 锚点格式：只检查行末尾的锚点（真正的锚点定义）
+            # 忽略代码块、示例文本中的锚点格式说明
+            if (
+                stripped.endswith("-->")
+                and not stripped.startswith("`")
+                and ": `" not in line
+            ):
+                if not self.ANCHOR_PATTERN.search(line):
                     self.errors.append(
                         f"Invalid anchor format at line {line_num}: {stripped}"
                     )
-                    continue
-
-                # 检查锚点是否在标题行或列表项
-                if not stripped.startswith("#") and not stripped.startswith("*"):
+                elif not starts_hash and not stripped.startswith("*"):
+                    # 检查锚点是否在标题行或列表项
                     self.warnings.append(
                         f"Anchor at line {line_num} is not on a heading or list item"
                     )
 
+            if not starts_hash:
+                continue
+
+            # 统计 H1
+            if stripped.startswith("# "):
+                h1_count += 1
+                if h1_count > 1:
+                    heading_warnings.append(
+                        f"Multiple H1 headings found at line {line_num}"
+                    )
+
+            # 检查 Domain 是否是 H2
+            if "Domain:" in stripped and not stripped.startswith("## "):
+                heading_warnings.append(
+                    f"Domain at line {line_num} should be H2 (##)"
+                )
+
+            # 检查 Feature 是否是 H3
+            if "Feature:" in stripped and not stripped.startswith("### "):
+                heading_warnings.append(
+                    f"Feature at line {line_num} should be H3 (###)"
+                )
+
+        return heading_warnings
+
     def _check_anchor_naming(self) -> None:
-        """检查锚点命名是否符合规范。"""
-        anchors = self.ANCHOR_PATTERN.findall(self.content)
+        """检查锚点命名：遍历全文中的所有锚点匹配。"""
+        for match in self.ANCHOR_PATTERN.finditer(self.content):
+            anchor = match.group(1)
 
-        for anchor in anchors:
             # 检查是否使用有效前缀
             if not anchor.startswith(self.VALID_PREFIXES):
                 self.warnings.append(
@@ -129,36 +179,14 @@ class PRDValidator:
                 continue
 
             # 检查是否使用 snake_case
-            if not re.match(r"^[a-z][a-z0-9_]*$", anchor):
+            if not self._is_snake_case(anchor):
                 self.warnings.append(
                     f"Anchor '{anchor}' is not in snake_case format"
                 )
 
-    def _check_heading_hierarchy(self) -> None:
-        """检查标题层级是否正确。"""
-        h1_count = 0
-
-        for line_num, line in enumerate(self.lines, start=1):
-            stripped = line.strip()
-
-            # 统计 H1
-            if stripped.startswith("# ") and not stripped.startswith("## "):
-                h1_count += 1
-                if h1_count > 1:
-                    self.warnings.append(
-                        f"Multiple H1 headings found at line {line_num}"
-                    )
-
-            # 检查 Domain 是否是 H2
-            if "Domain:" in stripped and stripped.startswith("#"):
-                if not stripped.startswith("## "):
-                    self.warnings.append(
-                        f"Domain at line {line_num} should be H2 (##)"
-                    )
-
-            # 检查 Feature 是否是 H3
-            if "Feature:" in stripped and stripped.startswith("#"):
-                if not stripped.startswith("### "):
-                    self.warnings.append(
-                        f"Feature at line {line_num} should be H3 (###)"
-                    )
+    def _is_snake_case(self, anchor: str) -> bool:
+        """判断锚点是否为 snake_case（小写字母开头，仅含 a-z、0-9、_）。"""
+        return (
+            "a" <= anchor[:1] <= "z"
+            and not anchor.translate(self.SNAKE_CASE_DELETE)
+        )
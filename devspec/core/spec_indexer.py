@@ -1,6 +1,19 @@
-import yaml
+import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Tuple
+
+from devspec.core._tree import scan_specgraph
+from devspec.core._yaml_cache import YAML_LOAD_ERRORS, load_yaml
+from devspec.core.spec_snapshot import (
+    SnapshotEntries,
+    is_plain,
+    load_snapshot,
+    save_snapshot,
+)
+
+# Runtime artifacts (database, caches) live here and are never spec files
+SKIP_DIRS = frozenset({".runtime"})
 
 class SpecIndexer:
     """
@@ -11,47 +24,111 @@ class SpecIndexer:
     def __init__(self, root_path: Path):
         self.root_path = root_path
         self.spec_dir = root_path / ".specgraph"
+        # Files that could not be loaded during the last index_all() run
+        self.warnings: List[str] = []
 
     def index_all(self) -> Dict[str, Dict[str, Any]]:
         """
         Walks through .specgraph and loads all valid YAML files.
         Returns a dictionary: {node_id: node_data_dict}
+        Unreadable files are skipped and reported in self.warnings.
         """
+        self.warnings = []
+
         if not self.spec_dir.exists():
             return {}
 
         index = {}
 
-        # Walk through all subdirectories
-        for file_path in self.spec_dir.rglob("*.yaml"):
-            # Skip .runtime or hidden folders if necessary
-            if ".runtime" in file_path.parts:
+        # Walk through all subdirectories, pruning .runtime during the walk
+        file_paths = scan_specgraph(self.spec_dir, SKIP_DIRS)
+
+        # Load contents (snapshot or parse); merge into the index on this thread
+        loaded = self._load_files(file_paths)
+
+        for file_path, (data, error) in zip(file_paths, loaded):
+            if error is not None:
+                self.warnings.append(f"Failed to parse {file_path}: {error}")
                 continue
-            
+
+            try:
+                if isinstance(data, dict) and "id" in data:
+                    node_id = data["id"]
+                    data["_file_path"] = str(file_path.relative_to(self.root_path))
+                    index[node_id] = data
+
+                    # Special handling for product.yaml to extract Domains
+                    if "domains" in data and isinstance(data["domains"], list):
+                        virtual_path = data["_file_path"] + "#domains"
+                        for dom in data["domains"]:
+                            if "id" in dom:
+                                dom_id = dom["id"]
+                                # Create a virtual node for the domain
+                                index[dom_id] = {
+                                    "id": dom_id,
+                                    "type": "domain",
+                                    "name": dom["name"] if "name" in dom else dom_id,
+                                    "description": dom["description"] if "description" in dom else "",
+                                    "_file_path": virtual_path,
+                                    "_is_virtual": True
+                                }
+            except (TypeError, AttributeError) as e:
+                # Malformed entries, e.g. a domain that is not a mapping
+                self.warnings.append(f"Failed to parse {file_path}: {e}")
+
+        return index
+
+    def _load_files(self, file_paths: List[Path]) -> List[Tuple[Any, Optional[Exception]]]:
+        """
+        Loads every file, reusing the on-disk snapshot for files whose
+        (mtime, size) is unchanged and parsing the rest in parallel.
+        The refreshed snapshot is written before callers mutate the data, and
+        only when its entries changed: files whose content cannot be stored
+        (e.g. YAML dates) are re-parsed each run without forcing a rewrite.
+        """
+        snapshot = load_snapshot(self.spec_dir)
+        fresh: SnapshotEntries = {}
+        loaded: List[Tuple[Any, Optional[Exception]]] = [(None, None)] * len(file_paths)
+        pending = []
+        changed = False
+
+        for i, file_path in enumerate(file_paths):
+            rel_path = file_path.relative_to(self.spec_dir).as_posix()
             try:
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    data = yaml.safe_load(f)
-                    
-                    if isinstance(data, dict) and "id" in data:
-                        node_id = data["id"]
-                        data["_file_path"] = str(file_path.relative_to(self.root_path))
-                        index[node_id] = data
-
-                        # Special handling for product.yaml to extract Domains
-                        if "domains" in data and isinstance(data["domains"], list):
-                            for dom in data["domains"]:
-                                if "id" in dom:
-                                    dom_id = dom["id"]
-                                    # Create a virtual node for the domain
-                                    index[dom_id] = {
-                                        "id": dom_id,
-                                        "type": "domain",
-                                        "name": dom.get("name", dom_id),
-                                        "description": dom.get("description", ""),
-                                        "_file_path": data["_file_path"] + "#domains", # Virtual path
-                                        "_is_virtual": True
-                                    }
-            except Exception as e:
-                print(f"Warning: Failed to parse {file_path}: {e}")
-
-        return index
\ No newline at end of file
+                st = file_path.stat()
+                stamp = (st.st_mtime_ns, st.st_size)
+            except OSError:
+                stamp = None
+
+            cached = snapshot.get(rel_path)
+            if stamp is not None and cached is not None and cached[:2] == stamp:
+                loaded[i] = (cached[2], None)
+                fresh[rel_path] = cached
+            else:
+                pending.append((i, rel_path, stamp))
+
+        if pending:
+            with ThreadPoolExecutor(max_workers=min(32, os.cpu_count() or 4)) as executor:
+                results = executor.map(
+                    self._load_file, [file_paths[i] for i, _, _ in pending]
+                )
+                for (i, rel_path, stamp), (data, error) in zip(pending, results):
+                    loaded[i] = (data, error)
+                    if error is None and stamp is not None and is_plain(data):
+                        fresh[rel_path] = (stamp[0], stamp[1], data)
+                        changed = True
+
+        if changed or len(fresh) != len(snapshot):
+            save_snapshot(self.spec_dir, fresh)
+
+        return loaded
+
+    def _load_file(self, file_path: Path) -> Tuple[Any, Optional[Exception]]:
+        """
+        Parses one YAML file, capturing expected load errors instead of raising
+        them so one bad file never aborts the whole index run.
+        """
+        try:
+            return load_yaml(file_path), None
+        except YAML_LOAD_ERRORS as e:
+            return None, e
@@ -0,0 +1,149 @@
+"""
+Spec Snapshot - On-disk cache of parsed spec YAML shared across runs.
+
+The snapshot lives in .specgraph/.runtime and maps each spec file (relative
+to .specgraph) to its (st_mtime_ns, st_size) stamp and parsed content. A later
+run reuses the content of every file whose stamp is unchanged and re-parses
+only the rest. msgspec's msgpack codec is used when installed, stdlib json
+otherwise.
+
+Only content that survives the round trip unchanged is stored (str keys and
+JSON-native values); anything else, such as YAML dates, is simply re-parsed.
+
+Component: comp_spec_indexer
+Feature: feat_consistency_monitor
+"""
+
+import json
+import os
+from pathlib import Path
+from typing import Any, Dict, Tuple
+
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+
+
+# =============================================================================
+# Constants
+# =============================================================================
+
+SNAPSHOT_VERSION = 1
+SNAPSHOT_DIR = ".runtime"
+SNAPSHOT_FILE = "index.msgpack" if msgspec is not None else "index.json"
+
+# rel_path -> (mtime_ns, size, parsed_data)
+SnapshotEntries = Dict[str, Tuple[int, int, Any]]
+
+
+# =============================================================================
+# Public API
+# =============================================================================
+
+def load_snapshot(spec_dir: Path) -> SnapshotEntries:
+    """
+    Load the parsed-spec snapshot for spec_dir.
+
+    Args:
+        spec_dir: The .specgraph directory
+
+    Returns:
+        Snapshot entries; empty if the snapshot is missing, unreadable or
+        was written by a different snapshot version
+    """
+    path = _snapshot_path(spec_dir)
+    try:
+        payload = _decode(path.read_bytes())
+    except (OSError, ValueError):
+        return {}
+
+    if not isinstance(payload, dict) or payload.get("version") != SNAPSHOT_VERSION:
+        return {}
+    files = payload.get("files")
+    if not isinstance(files, dict):
+        return {}
+
+    entries: SnapshotEntries = {}
+    for rel_path, entry in files.items():
+        if isinstance(entry, list) and len(entry) == 3:
+            entries[rel_path] = (entry[0], entry[1], entry[2])
+    return entries
+
+
+def save_snapshot(spec_dir: Path, entries: SnapshotEntries) -> None:
+    """
+    Write the parsed-spec snapshot for spec_dir.
+
+    Entries whose content would not round-trip unchanged are dropped. The
+    file is replaced atomically; failures (e.g. a read-only checkout) are
+    ignored since the snapshot is only an optimization.
+
+    Args:
+        spec_dir: The .specgraph directory
+        entries: Snapshot entries to store
+    """
+    try:
+        files = {
+            rel_path: [mtime_ns, size, data]
+            for rel_path, (mtime_ns, size, data) in entries.items()
+            if is_plain(data)
+        }
+        raw = _encode({"version": SNAPSHOT_VERSION, "files": files})
+    except (RecursionError, TypeError, ValueError, OverflowError):
+        # Self-referencing YAML aliases or values the codec cannot represent
+        return
+
+    path = _snapshot_path(spec_dir)
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path.write_bytes(raw)
+        os.replace(tmp_path, path)
+    except OSError:
+        try:
+            tmp_path.unlink()
+        except OSError:
+            pass
+
+
+def is_plain(data: Any) -> bool:
+    """
+    True if data consists only of str-keyed dicts, lists and JSON scalars,
+    i.e. it survives a snapshot round trip unchanged.
+    """
+    if data is None or isinstance(data, (str, bool, int, float)):
+        return True
+    if isinstance(data, list):
+        return all(is_plain(item) for item in data)
+    if isinstance(data, dict):
+        return all(
+            isinstance(key, str) and is_plain(value) for key, value in data.items()
+        )
+    return False
+
+
+# =============================================================================
+# Helper Functions
+# =============================================================================
+
+def _snapshot_path(spec_dir: Path) -> Path:
+    """Location of the snapshot file inside spec_dir."""
+    return Path(spec_dir) / SNAPSHOT_DIR / SNAPSHOT_FILE
+
+
+def _encode(payload: Dict[str, Any]) -> bytes:
+    """Serialize the snapshot payload."""
+    if msgspec is not None:
+        return msgspec.msgpack.encode(payload)
+    return json.dumps(payload, ensure_ascii=False).encode("utf-8")
+
+
+def _decode(raw: bytes) -> Any:
+    """Deserialize the snapshot payload; raises ValueError if corrupt."""
+    if msgspec is not None:
+        try:
+            return msgspec.msgpack.decode(raw)
+        except msgspec.DecodeError as e:
+            raise ValueError(str(e)) from e
+    return json.loads(raw)
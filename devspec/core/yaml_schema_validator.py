@@ -8,19 +8,31 @@ Component: comp_yaml_schema_validator
 Feature: feat_consistency_monitor
 """
 
+import os
+import re
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Callable
 
 import yaml
 
+from devspec.core._tree import scan_specgraph
+from devspec.core._yaml_cache import YAML_LOAD_ERRORS, load_yaml
+
 
 # =============================================================================
 # Constants
 # =============================================================================
 
-EXCLUDED_FILES = ["sub_meta_schema.yaml"]
-EXCLUDED_DIRS = [".runtime", "__pycache__"]
+EXCLUDED_FILES = frozenset({"sub_meta_schema.yaml"})
+EXCLUDED_DIRS = frozenset({".runtime", "__pycache__"})
+
+# 字段类型不符合预期（如 id: 123）时校验过程抛出的异常
+MALFORMED_DATA_ERRORS = (TypeError, AttributeError)
+
+# 并行验证文件时的最大线程数
+MAX_WORKERS = min(32, os.cpu_count() or 4)
 
 NODE_TYPE_PREFIXES = {
     "prod_": "product",
@@ -30,6 +42,15 @@ NODE_TYPE_PREFIXES = {
     "sub_": "substrate",
 }
 
+# 目录名 -> 节点类型（仅匹配完整的目录段，如 /features/）
+PATH_KIND_PATTERN = re.compile(r"(?:^|[\\/])(features|components|design|substrate)(?=[\\/])")
+PATH_KIND_NODE_TYPES = {
+    "features": "feature",
+    "components": "component",
+    "design": "design",
+    "substrate": "substrate",
+}
+
 REQUIRED_FIELDS = {
     "product": ["id", "name", "version", "description", "domains"],
     "feature": ["id", "domain", "source_anchor", "intent"],
@@ -38,12 +59,29 @@ REQUIRED_FIELDS = {
     "substrate": ["id", "type", "name"],
 }
 
+DOMAIN_REQUIRED_FIELDS = ["id", "name", "description"]
+
+# 预计算的集合形式，用于一次集合差运算判断是否缺少字段
+REQUIRED_FIELDS_SET = {k: frozenset(v) for k, v in REQUIRED_FIELDS.items()}
+DOMAIN_REQUIRED_FIELDS_SET = frozenset(DOMAIN_REQUIRED_FIELDS)
+
+# 预先格式化的缺失字段提示，所有文件共享同一字符串对象
+MISSING_FIELD_MESSAGES = {
+    name: f"Missing required field: {name}"
+    for fields in REQUIRED_FIELDS.values()
+    for name in fields
+}
+DOMAIN_MISSING_FIELD_MESSAGES = {
+    name: f"Domain missing required field: {name}" for name in DOMAIN_REQUIRED_FIELDS
+}
+
 
 # =============================================================================
 # Data Classes
 # =============================================================================
+# 每个被验证文件都会创建若干实例，使用 slots 省去每实例的 __dict__
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ValidationError:
     """验证错误信息."""
 
@@ -53,7 +91,7 @@ class ValidationError:
     severity: str = "error"  # error | warning
 
 
-@dataclass
+@dataclass(slots=True)
 class ValidationResult:
     """单个文件的验证结果."""
 
@@ -64,7 +102,7 @@ class ValidationResult:
     warnings: List[ValidationError] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class SchemaValidationReport:
     """完整验证报告."""
 
@@ -75,6 +113,35 @@ class SchemaValidationReport:
     results: List[ValidationResult] = field(default_factory=list)
 
 
+# =============================================================================
+# Helper Functions
+# =============================================================================
+
+def _missing_fields(
+    data: Dict[str, Any], ordered: List[str], required: frozenset
+) -> List[str]:
+    """
+    返回 data 中缺少的必填字段（保持 ordered 中的顺序）.
+
+    先做一次集合差运算；字段齐全（常见情况）时无需逐个检查.
+    """
+    missing = required - data.keys()
+    if not missing:
+        return []
+    return [name for name in ordered if name in missing]
+
+
+def _domain_ids(data: Any) -> List[str]:
+    """提取 product.yaml 数据中声明的 domain ID 列表."""
+    if not isinstance(data, dict) or not isinstance(data.get("domains"), list):
+        return []
+    return [
+        domain["id"]
+        for domain in data["domains"]
+        if isinstance(domain, dict) and "id" in domain
+    ]
+
+
 # =============================================================================
 # YAML Schema Validator
 # =============================================================================
@@ -90,22 +157,37 @@ class YAMLSchemaValidator:
             spec_dir: .specgraph 目录路径
         """
         self.spec_dir = Path(spec_dir)
-        self.valid_domains: List[str] = []
-        self._load_valid_domains()
-
-    def _load_valid_domains(self) -> None:
+        self.product_path = self.spec_dir / "product.yaml"
+        # 延迟加载：validate_all 验证 product.yaml 时顺带填充，无需单独解析
+        self._valid_domains: Optional[List[str]] = None
+        # 首次扫描后缓存文件列表，避免重复遍历目录树
+        self._yaml_files: Optional[List[Path]] = None
+        # 节点类型 -> 验证方法
+        self._validators: Dict[str, Callable[[Dict[str, Any], str], ValidationResult]] = {
+            "product": self._validate_product,
+            "feature": self._validate_feature,
+            "component": self._validate_component,
+            "design": self._validate_design,
+            "substrate": self._validate_substrate,
+        }
+        # validate_all 期间的目录列表缓存：目录路径 -> 其中的（非符号链接）条目名
+        self._dir_listings: Optional[Dict[str, frozenset]] = None
+
+    @property
+    def valid_domains(self) -> List[str]:
+        """product.yaml 中的有效 domain ID 列表（首次访问时加载）."""
+        if self._valid_domains is None:
+            self._valid_domains = self._load_valid_domains()
+        return self._valid_domains
+
+    def _load_valid_domains(self) -> List[str]:
         """加载 product.yaml 中的有效 domain ID 列表."""
-        product_path = self.spec_dir / "product.yaml"
-        if product_path.exists():
+        if self.product_path.exists():
             try:
-                content = product_path.read_text(encoding="utf-8")
-                data = yaml.safe_load(content)
-                if isinstance(data, dict) and "domains" in data:
-                    for domain in data.get("domains", []):
-                        if isinstance(domain, dict) and "id" in domain:
-                            self.valid_domains.append(domain["id"])
-            except Exception:
+                return _domain_ids(load_yaml(self.product_path))
+            except YAML_LOAD_ERRORS:
                 pass
+        return []
 
     def validate_all(self) -> SchemaValidationReport:
         """
@@ -117,8 +199,22 @@ class YAMLSchemaValidator:
         report = SchemaValidationReport()
         yaml_files = self._get_yaml_files()
 
-        for file_path in yaml_files:
-            result = self.validate_file(file_path)
+        # product.yaml 先行验证：其解析结果同时提供 feature 验证所需的 valid_domains
+        results: Dict[Path, ValidationResult] = {}
+        if self.product_path in yaml_files:
+            results[self.product_path] = self.validate_file(self.product_path)
+        pending = [f for f in yaml_files if f not in results]
+
+        # 其余文件的读取与解析相互独立，并行执行；统计仍在主线程中按原顺序汇总
+        # 同一目录下的代码文件共用一次 scandir 结果，而不是逐个 stat
+        self._dir_listings = {}
+        try:
+            with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+                results.update(zip(pending, executor.map(self.validate_file, pending)))
+        finally:
+            self._dir_listings = None
+
+        for result in (results[f] for f in yaml_files):
             report.results.append(result)
             report.total_files += 1
 
@@ -145,8 +241,7 @@ class YAMLSchemaValidator:
         rel_path = str(file_path.relative_to(self.spec_dir.parent))
 
         try:
-            content = file_path.read_text(encoding="utf-8")
-            data = yaml.safe_load(content)
+            data = load_yaml(file_path)
 
             if not isinstance(data, dict):
                 return ValidationResult(
@@ -162,6 +257,9 @@ class YAMLSchemaValidator:
                     ],
                 )
 
+            if file_path == self.product_path:
+                self._valid_domains = _domain_ids(data)
+
             node_type = self._detect_node_type(file_path, data)
 
             if node_type == "unknown":
@@ -179,37 +277,20 @@ class YAMLSchemaValidator:
                 )
 
             # 根据类型调用对应的验证方法
-            if node_type == "product":
-                return self._validate_product(data, rel_path)
-            elif node_type == "feature":
-                return self._validate_feature(data, rel_path)
-            elif node_type == "component":
-                return self._validate_component(data, rel_path)
-            elif node_type == "design":
-                return self._validate_design(data, rel_path)
-            elif node_type == "substrate":
-                return self._validate_substrate(data, rel_path)
-            else:
-                return ValidationResult(
-                    file_path=rel_path,
-                    node_type=node_type,
-                    is_valid=True,
-                )
-
-        except yaml.YAMLError as e:
+            validator = self._validators.get(node_type)
+            if validator is not None:
+                return validator(data, rel_path)
             return ValidationResult(
                 file_path=rel_path,
-                node_type="unknown",
-                is_valid=False,
-                errors=[
-                    ValidationError(
-                        file_path=rel_path,
-                        field="",
-                        message=f"YAML parse error: {e}",
-                    )
-                ],
+                node_type=node_type,
+                is_valid=True,
             )
-        except Exception as e:
+
+        except YAML_LOAD_ERRORS + MALFORMED_DATA_ERRORS as e:
+            if isinstance(e, yaml.YAMLError):
+                message = f"YAML parse error: {e}"
+            else:
+                message = f"Error reading file: {e}"
             return ValidationResult(
                 file_path=rel_path,
                 node_type="unknown",
@@ -218,30 +299,41 @@ class YAMLSchemaValidator:
                     ValidationError(
                         file_path=rel_path,
                         field="",
-                        message=f"Error reading file: {e}",
+                        message=message,
                     )
                 ],
             )
 
     def _get_yaml_files(self) -> List[Path]:
-        """获取所有需要验证的 YAML 文件."""
-        yaml_files = []
-        for file_path in self.spec_dir.rglob("*.yaml"):
-            # 检查是否在排除目录中
-            skip = False
-            for skip_dir in EXCLUDED_DIRS:
-                if skip_dir in file_path.parts:
-                    skip = True
-                    break
+        """获取所有需要验证的 YAML 文件（单次遍历，排除目录在遍历时剪枝）."""
+        if self._yaml_files is None:
+            self._yaml_files = scan_specgraph(
+                self.spec_dir, EXCLUDED_DIRS, EXCLUDED_FILES
+            )
+        return list(self._yaml_files)
 
-            # 检查是否是排除文件
-            if file_path.name in EXCLUDED_FILES:
-                skip = True
+    def _code_file_exists(self, full_path: Path) -> bool:
+        """
+        判断代码文件是否存在.
+
+        validate_all 期间先查所在目录的 scandir 缓存；未命中（含大小写不敏感的
+        文件系统、符号链接等情况）时再回退到 exists() 确认.
+        """
+        listings = self._dir_listings
+        if listings is None:
+            return full_path.exists()
 
-            if not skip:
-                yaml_files.append(file_path)
+        parent = str(full_path.parent)
+        names = listings.get(parent)
+        if names is None:
+            try:
+                with os.scandir(parent) as entries:
+                    names = frozenset(e.name for e in entries if not e.is_symlink())
+            except OSError:
+                names = frozenset()
+            listings[parent] = names
 
-        return yaml_files
+        return full_path.name in names or full_path.exists()
 
     def _detect_node_type(self, file_path: Path, data: Dict[str, Any]) -> str:
         """
@@ -256,17 +348,11 @@ class YAMLSchemaValidator:
                 if node_id.startswith(prefix):
                     return node_type
 
-        # 从文件路径判断
-        path_str = str(file_path)
-        if "features" in path_str or "/features/" in path_str or "\\features\\" in path_str:
-            return "feature"
-        elif "components" in path_str or "/components/" in path_str or "\\components\\" in path_str:
-            return "component"
-        elif "design" in path_str or "/design/" in path_str or "\\design\\" in path_str:
-            return "design"
-        elif "substrate" in path_str or "/substrate/" in path_str or "\\substrate\\" in path_str:
-            return "substrate"
-        elif file_path.name == "product.yaml":
+        # 从文件路径判断（取最靠近文件的目录段）
+        path_kinds = PATH_KIND_PATTERN.findall(str(file_path))
+        if path_kinds:
+            return PATH_KIND_NODE_TYPES[path_kinds[-1]]
+        if file_path.name == "product.yaml":
             return "product"
 
         return "unknown"
@@ -277,15 +363,16 @@ class YAMLSchemaValidator:
         warnings: List[ValidationError] = []
 
         # 检查必填字段
-        for field_name in REQUIRED_FIELDS["product"]:
-            if field_name not in data:
-                errors.append(
-                    ValidationError(
-                        file_path=file_path,
-                        field=field_name,
-                        message=f"Missing required field: {field_name}",
-                    )
+        for field_name in _missing_fields(
+            data, REQUIRED_FIELDS["product"], REQUIRED_FIELDS_SET["product"]
+        ):
+            errors.append(
+                ValidationError(
+                    file_path=file_path,
+                    field=field_name,
+                    message=MISSING_FIELD_MESSAGES[field_name],
                 )
+            )
 
         # 检查 id 格式
         node_id = data.get("id", "")
@@ -319,15 +406,16 @@ class YAMLSchemaValidator:
                         )
                     )
                 else:
-                    for req_field in ["id", "name", "description"]:
-                        if req_field not in domain:
-                            errors.append(
-                                ValidationError(
-                                    file_path=file_path,
-                                    field=f"domains[{i}].{req_field}",
-                                    message=f"Domain missing required field: {req_field}",
-                                )
+                    for req_field in _missing_fields(
+                        domain, DOMAIN_REQUIRED_FIELDS, DOMAIN_REQUIRED_FIELDS_SET
+                    ):
+                        errors.append(
+                            ValidationError(
+                                file_path=file_path,
+                                field=f"domains[{i}].{req_field}",
+                                message=DOMAIN_MISSING_FIELD_MESSAGES[req_field],
                             )
+                        )
 
         return ValidationResult(
             file_path=file_path,
@@ -343,15 +431,16 @@ class YAMLSchemaValidator:
         warnings: List[ValidationError] = []
 
         # 检查必填字段
-        for field_name in REQUIRED_FIELDS["feature"]:
-            if field_name not in data:
-                errors.append(
-                    ValidationError(
-                        file_path=file_path,
-                        field=field_name,
-                        message=f"Missing required field: {field_name}",
-                    )
+        for field_name in _missing_fields(
+            data, REQUIRED_FIELDS["feature"], REQUIRED_FIELDS_SET["feature"]
+        ):
+            errors.append(
+                ValidationError(
+                    file_path=file_path,
+                    field=field_name,
+                    message=MISSING_FIELD_MESSAGES[field_name],
                 )
+            )
 
         # 检查 id 格式
         node_id = data.get("id", "")
@@ -413,15 +502,16 @@ class YAMLSchemaValidator:
         warnings: List[ValidationError] = []
 
         # 检查必填字段
-        for field_name in REQUIRED_FIELDS["component"]:
-            if field_name not in data:
-                errors.append(
-                    ValidationError(
-                        file_path=file_path,
-                        field=field_name,
-                        message=f"Missing required field: {field_name}",
-                    )
+        for field_name in _missing_fields(
+            data, REQUIRED_FIELDS["component"], REQUIRED_FIELDS_SET["component"]
+        ):
+            errors.append(
+                ValidationError(
+                    file_path=file_path,
+                    field=field_name,
+                    message=MISSING_FIELD_MESSAGES[field_name],
                 )
+            )
 
         # 检查 id 格式
         node_id = data.get("id", "")
@@ -478,7 +568,7 @@ class YAMLSchemaValidator:
         if code_path:
             # 相对于项目根目录
             full_path = self.spec_dir.parent / code_path
-            if not full_path.exists() and not code_path.endswith("/"):
+            if not code_path.endswith("/") and not self._code_file_exists(full_path):
                 warnings.append(
                     ValidationError(
                         file_path=file_path,
@@ -502,15 +592,16 @@ class YAMLSchemaValidator:
         warnings: List[ValidationError] = []
 
         # 检查必填字段
-        for field_name in REQUIRED_FIELDS["design"]:
-            if field_name not in data:
-                errors.append(
-                    ValidationError(
-                        file_path=file_path,
-                        field=field_name,
-                        message=f"Missing required field: {field_name}",
-                    )
+        for field_name in _missing_fields(
+            data, REQUIRED_FIELDS["design"], REQUIRED_FIELDS_SET["design"]
+        ):
+            errors.append(
+                ValidationError(
+                    file_path=file_path,
+                    field=field_name,
+                    message=MISSING_FIELD_MESSAGES[field_name],
                 )
+            )
 
         # 检查 id 格式
         node_id = data.get("id", "")
@@ -548,15 +639,16 @@ class YAMLSchemaValidator:
         warnings: List[ValidationError] = []
 
         # 检查必填字段
-        for field_name in REQUIRED_FIELDS["substrate"]:
-            if field_name not in data:
-                errors.append(
-                    ValidationError(
-                        file_path=file_path,
-                        field=field_name,
-                        message=f"Missing required field: {field_name}",
-                    )
+        for field_name in _missing_fields(
+            data, REQUIRED_FIELDS["substrate"], REQUIRED_FIELDS_SET["substrate"]
+        ):
+            errors.append(
+                ValidationError(
+                    file_path=file_path,
+                    field=field_name,
+                    message=MISSING_FIELD_MESSAGES[field_name],
                 )
+            )
 
         # 检查 id 格式
         node_id = data.get("id", "")
@@ -149,14 +149,12 @@ def check_cmd(
     # 显示错误
     if result.errors:
         console.print("\n[red]错误:[/red]")
-        for error in result.errors:
-            console.print(f"  • {error}")
+        console.print("\n".join(f"  • {error}" for error in result.errors))
 
     # 显示警告
     if result.warnings:
         console.print("\n[yellow]警告:[/yellow]")
-        for warning in result.warnings:
-            console.print(f"  • {warning}")
+        console.print("\n".join(f"  • {warning}" for warning in result.warnings))
 
     # 显示结果摘要
     if result.is_valid:
@@ -224,5 +222,4 @@ def stats_cmd(
     unused = stats.get_unused()
     if unused:
         console.print(f"\n[yellow]未使用的组件 ({len(unused)}):[/yellow]")
-        for comp_id in unused:
-            console.print(f"  • {comp_id}")
+        console.print("\n".join(f"  • {comp_id}" for comp_id in unused))
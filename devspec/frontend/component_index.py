@@ -8,6 +8,8 @@ from typing import Dict, List, Optional
 
 import yaml
 
+from devspec.core._yaml_cache import load_yaml
+
 from .models import ComponentInfo, ParamInfo
 
 INDEX_FILE = "_index.yaml"
@@ -30,6 +32,8 @@ class ComponentIndex:
         """
         self.root_path = root_path
         self.components: Dict[str, ComponentInfo] = {}
+        # 组件 ID -> 小写的可搜索文本 (id, desc, 参数名与描述)，供 search 使用
+        self._haystack: Dict[str, str] = {}
         self.load()
 
     def load(self) -> None:
@@ -38,19 +42,22 @@ class ComponentIndex:
 
         if not index_file.exists():
             self.components = {}
+            self._haystack = {}
             return
 
         try:
-            with open(index_file, "r", encoding="utf-8") as f:
-                data = yaml.safe_load(f)
+            # 索引未变化时复用已解析结果 (按 mtime/size 缓存)
+            data = load_yaml(index_file)
         except yaml.YAMLError as e:
             raise ComponentIndexError(f"索引文件 YAML 格式错误: {e}")
 
         if not data or "components" not in data:
             self.components = {}
+            self._haystack = {}
             return
 
         self.components = {}
+        self._haystack = {}
         for item in data.get("components", []):
             params = []
             for p in item.get("params", []):
@@ -74,6 +81,7 @@ class ComponentIndex:
                 example=item.get("example"),
             )
             self.components[comp.id] = comp
+            self._haystack[comp.id] = _build_haystack(comp)
 
     def list_components(self) -> List[ComponentInfo]:
         """列出所有已注册的组件
@@ -104,26 +112,22 @@ class ComponentIndex:
             匹配的组件列表
         """
         keyword_lower = keyword.lower()
-        results = []
-
-        for comp in self.components.values():
-            # 搜索 id
-            if keyword_lower in comp.id.lower():
-                results.append(comp)
-                continue
-
-            # 搜索 desc
-            if keyword_lower in comp.desc.lower():
-                results.append(comp)
-                continue
-
-            # 搜索 params
-            for param in comp.params:
-                if (
-                    keyword_lower in param.name.lower()
-                    or keyword_lower in param.desc.lower()
-                ):
-                    results.append(comp)
-                    break
-
-        return results
+        haystack = self._haystack
+
+        return [
+            comp
+            for comp_id, comp in self.components.items()
+            if keyword_lower in haystack[comp_id]
+        ]
+
+
+def _build_haystack(comp: ComponentInfo) -> str:
+    """拼接组件的可搜索字段并转为小写
+
+    字段之间以 \\0 分隔，关键词不会跨字段匹配
+    """
+    fields = [comp.id, comp.desc]
+    for param in comp.params:
+        fields.append(param.name)
+        fields.append(param.desc)
+    return "\0".join(field.lower() for field in fields)
@@ -6,14 +6,47 @@ Part of comp_frontend_component_library
 必须先注册（创建 MD 文档）再编码（写 HTML）
 """
 
+import os
 from pathlib import Path
 from typing import List, Optional
 
 import yaml
 
+from devspec.core._yaml_cache import invalidate, load_yaml
+
 from .component_index import INDEX_FILE
 from .models import ComponentInfo, ParamInfo
 
+try:
+    from yaml import CSafeDumper as _SafeDumper
+except ImportError:
+    from yaml import SafeDumper as _SafeDumper
+
+# 组件 MD 文档模板 (str.format 占位符: id, desc, params_table, example)
+MD_TEMPLATE = """# {id}
+
+## 描述
+{desc}
+
+## 参数
+{params_table}
+## 样式规范
+- 使用 Tailwind CSS 类
+- 遵循 sub_frontend_style.yaml 定义的调色板
+- 主色: blue-600, 次色: gray-600
+- (待完善)
+
+## 使用示例
+```jinja2
+{example}
+```
+
+## 设计备注
+(待填写)
+"""
+
+MD_PARAMS_TABLE_HEADER = "| 名称 | 类型 | 必填 | 描述 |\n|------|------|------|------|\n"
+
 
 class ComponentRegistrarError(Exception):
     """组件注册错误"""
@@ -71,14 +104,14 @@ class ComponentRegistrar:
         index_file = self.root_path / INDEX_FILE
         existing_components = []
         if index_file.exists():
-            with open(index_file, "r", encoding="utf-8") as f:
-                data = yaml.safe_load(f) or {}
-                existing_components = data.get("components", [])
-                for comp in existing_components:
-                    if comp.get("id") == component_id:
-                        raise ComponentRegistrarError(
-                            f"组件 '{component_id}' 已存在"
-                        )
+            # 索引未变化时复用已解析结果 (按 mtime/size 缓存)
+            data = load_yaml(index_file) or {}
+            existing_components = data.get("components", [])
+            existing_ids = {comp.get("id") for comp in existing_components}
+            if component_id in existing_ids:
+                raise ComponentRegistrarError(
+                    f"组件 '{component_id}' 已存在"
+                )
 
         # 创建目录
         category_dir = self.root_path / category
@@ -118,34 +151,18 @@ class ComponentRegistrar:
             MD 文档内容
         """
         # 生成参数表格
-        params_table = "| 名称 | 类型 | 必填 | 描述 |\n|------|------|------|------|\n"
-        if component.params:
-            for param in component.params:
-                params_table += f"| {param.name} | {param.type} | 是 | {param.desc} |\n"
-        else:
-            params_table += "| (无参数) | - | - | - |\n"
-
-        return f"""# {component.id}
-
-## 描述
-{component.desc}
-
-## 参数
-{params_table}
-## 样式规范
-- 使用 Tailwind CSS 类
-- 遵循 sub_frontend_style.yaml 定义的调色板
-- 主色: blue-600, 次色: gray-600
-- (待完善)
-
-## 使用示例
-```jinja2
-{component.example}
-```
-
-## 设计备注
-(待填写)
-"""
+        rows = [
+            f"| {param.name} | {param.type} | 是 | {param.desc} |\n"
+            for param in component.params
+        ] or ["| (无参数) | - | - | - |\n"]
+        params_table = MD_PARAMS_TABLE_HEADER + "".join(rows)
+
+        return MD_TEMPLATE.format(
+            id=component.id,
+            desc=component.desc,
+            params_table=params_table,
+            example=component.example,
+        )
 
     def _update_index(
         self, component: ComponentInfo, existing_components: List[dict]
@@ -187,11 +204,20 @@ class ComponentRegistrar:
             "components": existing_components,
         }
 
-        with open(index_file, "w", encoding="utf-8") as f:
-            yaml.dump(
-                index_data,
-                f,
-                allow_unicode=True,
-                default_flow_style=False,
-                sort_keys=False,
-            )
+        content = yaml.dump(
+            index_data,
+            Dumper=_SafeDumper,
+            allow_unicode=True,
+            default_flow_style=False,
+            sort_keys=False,
+        )
+
+        # 先写临时文件再原子替换，读取方不会看到写了一半的索引
+        tmp_file = index_file.with_name(f"{index_file.name}.{os.getpid()}.tmp")
+        try:
+            tmp_file.write_text(content, encoding="utf-8")
+            os.replace(tmp_file, index_file)
+        except OSError:
+            tmp_file.unlink(missing_ok=True)
+            raise
+        invalidate(index_file)
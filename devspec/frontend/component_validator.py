@@ -12,8 +12,9 @@ Part of comp_frontend_component_library
 """
 
 import re
+from collections import OrderedDict
 from pathlib import Path
-from typing import List, Set
+from typing import Any, Callable, FrozenSet, List, Set, Tuple
 
 import yaml
 
@@ -26,16 +27,90 @@ COMPONENT_ID_PATTERN = re.compile(r"^comp_[a-z]+_[a-z_]+$")
 # Jinja2 变量提取正则：{{ variable }} 或 {{ variable.attr }}
 JINJA2_VARIABLE_PATTERN = re.compile(r"\{\{\s*([a-zA-Z_][a-zA-Z0-9_]*)")
 
+# MD 参数章节：从含 "## 参数" 的行之后，到下一个 "## " 开头的章节 (含 "## 参数" 的行除外)
+MD_PARAMS_SECTION_PATTERN = re.compile(
+    r"## 参数[^\n]*\n(.*?)(?=^(?![^\n]*## 参数)## |\Z)", re.MULTILINE | re.DOTALL
+)
+
+# MD 表格行：整行及第一列内容
+MD_TABLE_ROW_PATTERN = re.compile(r"^\|([^|\n]*)[^\n]*", re.MULTILINE)
+
 # HTML class 属性提取正则
 HTML_CLASS_PATTERN = re.compile(r'class\s*=\s*["\']([^"\']+)["\']')
 
 # sub_frontend_style.yaml 允许的颜色和前缀
-ALLOWED_COLOR_NAMES = {
+ALLOWED_COLOR_NAMES = frozenset({
     "blue", "gray", "green", "yellow", "red", "white",
     "primary", "secondary", "success", "warning", "error"
-}
+})
+# 警告信息中列出的规范颜色 (预先排序拼接)
+ALLOWED_COLOR_NAMES_TEXT = ", ".join(sorted(ALLOWED_COLOR_NAMES))
 CUSTOM_CLASS_PREFIX = "ds-"
 
+# 颜色类提取正则：text-/bg-/border-{color}-{shade}
+COLOR_CLASS_PATTERN = re.compile(r"^(?:text|bg|border)-([a-z]+)-\d+$")
+
+# 组件文件名规范: snake_case
+SNAKE_CASE_PATTERN = re.compile(r"^[a-z][a-z0-9_]*$")
+
+# Tailwind 类的常见前缀
+TAILWIND_PREFIXES = (
+    "p-", "m-", "px-", "py-", "mx-", "my-", "pt-", "pb-", "pl-", "pr-",
+    "mt-", "mb-", "ml-", "mr-",
+    "w-", "h-", "min-w-", "min-h-", "max-w-", "max-h-",
+    "text-", "font-", "leading-", "tracking-",
+    "bg-", "border-", "rounded-", "shadow-",
+    "flex", "grid", "block", "inline", "hidden",
+    "items-", "justify-", "gap-", "space-",
+    "absolute", "relative", "fixed", "sticky",
+    "top-", "bottom-", "left-", "right-",
+    "z-", "overflow-", "cursor-",
+    "opacity-", "transition", "duration-", "ease-",
+    "hover:", "focus:", "active:", "disabled:",
+    "sm:", "md:", "lg:", "xl:", "2xl:",
+    "dark:",
+)
+
+# 所有前缀合并为一个锚定正则，一次匹配代替逐个 startswith
+TAILWIND_PREFIX_PATTERN = re.compile(
+    "(?:" + "|".join(map(re.escape, TAILWIND_PREFIXES)) + ")"
+)
+
+# 提取结果缓存的条目上限，超出时淘汰最久未使用的条目
+MAX_EXTRACT_CACHE_ENTRIES = 1024
+
+# (文件路径, 提取函数名) -> ((st_mtime_ns, st_size), 提取结果)，按 LRU 顺序 (最近使用的在末尾)
+_extract_cache: "OrderedDict[Tuple[Path, str], Tuple[Tuple[int, int], Any]]" = (
+    OrderedDict()
+)
+
+
+def _extract_cached(path: Path, extract: Callable[[str], Any]) -> Any:
+    """读取文件并提取信息，文件 (mtime, size) 未变化时直接返回上次结果
+
+    Args:
+        path: 文件路径
+        extract: 从文件内容提取信息的函数，结果不应被调用方修改
+
+    Returns:
+        extract 的返回值
+    """
+    st = path.stat()
+    stamp = (st.st_mtime_ns, st.st_size)
+    key = (path, extract.__name__)
+
+    entry = _extract_cache.get(key)
+    if entry is not None and entry[0] == stamp:
+        _extract_cache.move_to_end(key)
+        return entry[1]
+
+    result = extract(path.read_text(encoding="utf-8"))
+    _extract_cache[key] = (stamp, result)
+    _extract_cache.move_to_end(key)
+    while len(_extract_cache) > MAX_EXTRACT_CACHE_ENTRIES:
+        _extract_cache.popitem(last=False)
+    return result
+
 
 class ComponentValidator:
     """组件验证器"""
@@ -97,13 +172,25 @@ class ComponentValidator:
         Returns:
             验证结果
         """
-        result = ValidationResult()
-
         comp = self.index.get_component(component_id)
         if not comp:
+            result = ValidationResult()
             result.add_error(f"组件 '{component_id}' 不存在于索引中")
             return result
 
+        return self._validate_component(comp)
+
+    def _validate_component(self, comp: ComponentInfo) -> ValidationResult:
+        """验证已从索引取出的组件
+
+        Args:
+            comp: 组件信息
+
+        Returns:
+            验证结果
+        """
+        result = ValidationResult()
+
         # 1. 检查 MD 文档是否存在 (Truth)
         # 兼容旧格式：如果 md_path 为空，从 html_path 推导
         md_path = comp.md_path
@@ -127,7 +214,7 @@ class ComponentValidator:
 
         # 2. 检查文件命名是否符合 snake_case
         filename = Path(md_path).stem
-        if not re.match(r"^[a-z][a-z0-9_]*$", filename):
+        if not SNAKE_CASE_PATTERN.match(filename):
             result.add_warning(f"组件文件名 '{filename}' 不符合 snake_case 规范")
 
         # 3. 如果 status != registered，检查 HTML 是否存在
@@ -144,7 +231,7 @@ class ComponentValidator:
         # 4. 如果 HTML 存在，进行 MD-HTML 一致性检查
         if html_file.exists():
             html_result = self._validate_html_consistency(comp, md_file, html_file)
-            result = result.merge(html_result)
+            result.absorb(html_result)
 
         return result
 
@@ -167,19 +254,19 @@ class ComponentValidator:
         """
         result = ValidationResult()
 
-        # 读取 HTML 内容
-        html_content = html_file.read_text(encoding="utf-8")
+        # 读取 HTML 内容，提取变量和 CSS 类 (文件未变化时复用上次结果)
+        html_variables, all_classes = _extract_cached(
+            html_file, self._extract_html_facts
+        )
 
         # 读取 MD 内容，提取参数定义
-        md_content = md_file.read_text(encoding="utf-8")
-        md_params = self._extract_params_from_md(md_content)
+        md_params = _extract_cached(md_file, self._extract_params_from_md)
 
         # 从索引获取参数（如果 MD 解析失败则使用索引）
         index_params = {p.name for p in comp.params}
         defined_params = md_params if md_params else index_params
 
         # 1. 检查 HTML 中使用的参数是否在 MD 中定义
-        html_variables = self._extract_variables_from_html(html_content)
         # 过滤掉 Jinja2 内置变量和循环变量
         builtin_vars = {"loop", "range", "true", "false", "none", "self"}
         html_variables = html_variables - builtin_vars
@@ -192,12 +279,28 @@ class ComponentValidator:
                 )
 
         # 2. 检查 HTML 中的 CSS 类是否符合 sub_frontend_style.yaml
-        css_result = self._validate_css_classes(comp.id, html_content)
-        result = result.merge(css_result)
+        css_result = self._validate_css_classes(comp.id, all_classes)
+        result.absorb(css_result)
 
         return result
 
-    def _extract_params_from_md(self, md_content: str) -> Set[str]:
+    def _extract_html_facts(
+        self, html_content: str
+    ) -> Tuple[FrozenSet[str], FrozenSet[str]]:
+        """从 HTML 模板中一次性提取 Jinja2 变量名和 CSS 类
+
+        Args:
+            html_content: HTML 内容
+
+        Returns:
+            (变量名集合, CSS 类集合)
+        """
+        return (
+            frozenset(self._extract_variables_from_html(html_content)),
+            frozenset(self._extract_classes_from_html(html_content)),
+        )
+
+    def _extract_params_from_md(self, md_content: str) -> FrozenSet[str]:
         """从 MD 文档中提取参数名
 
         Args:
@@ -206,32 +309,22 @@ class ComponentValidator:
         Returns:
             参数名集合
         """
-        params = set()
+        # 定位 "## 参数" 之后到下一个章节之前的内容
+        section = MD_PARAMS_SECTION_PATTERN.search(md_content)
+        if not section:
+            return frozenset()
 
-        # 查找参数表格部分
-        # 格式: | 名称 | 类型 | 必填 | 描述 |
-        lines = md_content.split("\n")
-        in_params_section = False
-
-        for line in lines:
-            if "## 参数" in line:
-                in_params_section = True
+        # 解析表格行，格式: | 名称 | 类型 | 必填 | 描述 |
+        params = set()
+        for row in MD_TABLE_ROW_PATTERN.finditer(section.group(1)):
+            line = row.group(0)
+            if "---" in line or "名称" in line or "## 参数" in line:
                 continue
+            param_name = row.group(1).strip()
+            if param_name and param_name != "(无参数)":
+                params.add(param_name)
 
-            if in_params_section:
-                # 遇到下一个章节则停止
-                if line.startswith("## "):
-                    break
-
-                # 解析表格行
-                if line.startswith("|") and "---" not in line and "名称" not in line:
-                    parts = [p.strip() for p in line.split("|")]
-                    if len(parts) >= 2 and parts[1]:
-                        param_name = parts[1]
-                        if param_name and param_name != "(无参数)":
-                            params.add(param_name)
-
-        return params
+        return frozenset(params)
 
     def _extract_variables_from_html(self, html_content: str) -> Set[str]:
         """从 HTML 模板中提取 Jinja2 变量名
@@ -244,8 +337,21 @@ class ComponentValidator:
         """
         return set(JINJA2_VARIABLE_PATTERN.findall(html_content))
 
+    def _extract_classes_from_html(self, html_content: str) -> Set[str]:
+        """从 HTML 中提取所有 CSS 类名
+
+        Args:
+            html_content: HTML 内容
+
+        Returns:
+            CSS 类名集合
+        """
+        # 提取所有 class 属性值，拼接后一次性按空白切分
+        class_matches = HTML_CLASS_PATTERN.findall(html_content)
+        return set(" ".join(class_matches).split())
+
     def _validate_css_classes(
-        self, component_id: str, html_content: str
+        self, component_id: str, all_classes: Set[str]
     ) -> ValidationResult:
         """验证 HTML 中的 CSS 类是否符合规范
 
@@ -256,19 +362,13 @@ class ComponentValidator:
 
         Args:
             component_id: 组件 ID
-            html_content: HTML 内容
+            all_classes: HTML 中出现的 CSS 类名集合
 
         Returns:
             验证结果
         """
         result = ValidationResult()
 
-        # 提取所有 class 属性值
-        class_matches = HTML_CLASS_PATTERN.findall(html_content)
-        all_classes: Set[str] = set()
-        for match in class_matches:
-            all_classes.update(match.split())
-
         for css_class in all_classes:
             # 跳过 Tailwind 标准类（常见模式）
             if self._is_tailwind_class(css_class):
@@ -296,25 +396,7 @@ class ComponentValidator:
         Returns:
             是否为 Tailwind 类
         """
-        # Tailwind 类的常见前缀
-        tailwind_prefixes = (
-            "p-", "m-", "px-", "py-", "mx-", "my-", "pt-", "pb-", "pl-", "pr-",
-            "mt-", "mb-", "ml-", "mr-",
-            "w-", "h-", "min-w-", "min-h-", "max-w-", "max-h-",
-            "text-", "font-", "leading-", "tracking-",
-            "bg-", "border-", "rounded-", "shadow-",
-            "flex", "grid", "block", "inline", "hidden",
-            "items-", "justify-", "gap-", "space-",
-            "absolute", "relative", "fixed", "sticky",
-            "top-", "bottom-", "left-", "right-",
-            "z-", "overflow-", "cursor-",
-            "opacity-", "transition", "duration-", "ease-",
-            "hover:", "focus:", "active:", "disabled:",
-            "sm:", "md:", "lg:", "xl:", "2xl:",
-            "dark:",
-        )
-
-        return any(css_class.startswith(prefix) for prefix in tailwind_prefixes)
+        return TAILWIND_PREFIX_PATTERN.match(css_class) is not None
 
     def _check_color_compliance(self, css_class: str) -> str:
         """检查颜色类是否使用规范颜色
@@ -326,19 +408,14 @@ class ComponentValidator:
             警告信息，如果合规则返回空字符串
         """
         # 提取颜色名（如 bg-red-500 中的 red）
-        color_patterns = [
-            (r"^(?:text|bg|border)-([a-z]+)-\d+$", "颜色"),
-        ]
-
-        for pattern, color_type in color_patterns:
-            match = re.match(pattern, css_class)
-            if match:
-                color_name = match.group(1)
-                if color_name not in ALLOWED_COLOR_NAMES:
-                    return (
-                        f"CSS 类 '{css_class}' 使用了非规范{color_type} '{color_name}'，"
-                        f"建议使用: {', '.join(sorted(ALLOWED_COLOR_NAMES))}"
-                    )
+        match = COLOR_CLASS_PATTERN.match(css_class)
+        if match:
+            color_name = match.group(1)
+            if color_name not in ALLOWED_COLOR_NAMES:
+                return (
+                    f"CSS 类 '{css_class}' 使用了非规范颜色 '{color_name}'，"
+                    f"建议使用: {ALLOWED_COLOR_NAMES_TEXT}"
+                )
 
         return ""
 
@@ -350,8 +427,9 @@ class ComponentValidator:
         """
         result = self.validate_index()
 
+        # 直接传入组件对象，无需按 ID 再查一次索引
         for comp in self.index.list_components():
-            comp_result = self.validate_component(comp.id)
-            result = result.merge(comp_result)
+            comp_result = self._validate_component(comp)
+            result.absorb(comp_result)
 
         return result
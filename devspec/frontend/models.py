@@ -7,7 +7,7 @@ from dataclasses import dataclass, field
 from typing import List, Optional
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ParamInfo:
     """组件参数信息"""
 
@@ -16,7 +16,7 @@ class ParamInfo:
     desc: str
 
 
-@dataclass
+@dataclass(slots=True)
 class ValidationResult:
     """验证结果数据类"""
 
@@ -32,6 +32,12 @@ class ValidationResult:
             warnings=self.warnings + other.warnings,
         )
 
+    def absorb(self, other: "ValidationResult") -> None:
+        """就地合并另一个验证结果 (汇总多个结果时使用，避免反复复制列表)"""
+        self.is_valid = self.is_valid and other.is_valid
+        self.errors.extend(other.errors)
+        self.warnings.extend(other.warnings)
+
     def add_error(self, msg: str) -> None:
         """添加错误"""
         self.errors.append(msg)
@@ -42,7 +48,7 @@ class ValidationResult:
         self.warnings.append(msg)
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ComponentInfo:
     """组件信息数据类"""
 
@@ -3,15 +3,49 @@ Frontend Component Library - Usage Statistics
 Part of comp_frontend_component_library
 """
 
+import os
 import re
+from collections import Counter
 from pathlib import Path
-from typing import Dict, List
+from typing import Dict, Iterator, List, Tuple
 
 from .component_index import ComponentIndex
 
 # Jinja2 include 模式: {% include "components/..." %}
 INCLUDE_PATTERN = re.compile(r'{%\s*include\s*["\']components/([^"\']+)["\']\s*%}')
 
+# 同一模式的 bytes 版本，直接匹配文件原始字节，无需先解码
+INCLUDE_PATTERN_BYTES = re.compile(INCLUDE_PATTERN.pattern.encode("utf-8"))
+
+# 模板根目录下存放组件本身的子目录，不参与统计
+COMPONENTS_DIR = "components"
+
+
+def _iter_html_files(templates_path: Path) -> Iterator[str]:
+    """遍历模板目录下的 .html 文件 (跳过顶层 components 目录)
+
+    Args:
+        templates_path: 模板文件根目录
+
+    Yields:
+        HTML 文件路径
+    """
+    stack = [(str(templates_path), True)]
+    while stack:
+        dir_path, is_top = stack.pop()
+        try:
+            entries = os.scandir(dir_path)
+        except OSError:
+            continue
+        with entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    # 按目录名直接剪枝，不进入组件目录
+                    if not (is_top and entry.name == COMPONENTS_DIR):
+                        stack.append((entry.path, False))
+                elif entry.name.endswith(".html"):
+                    yield entry.path
+
 
 class UsageStatistics:
     """组件使用统计"""
@@ -25,6 +59,23 @@ class UsageStatistics:
         """
         self.index = index
         self.templates_path = templates_path
+        self._component_ids: List[str] = []
+        self._path_to_id: Dict[bytes, str] = {}
+        # HTML 文件路径 -> ((st_mtime_ns, st_size), 该文件的 include 路径计数)
+        self._include_cache: Dict[str, Tuple[Tuple[int, int], Counter]] = {}
+        self.invalidate()
+
+    def invalidate(self) -> None:
+        """根据当前索引重建组件 ID 列表和 path -> id 映射
+
+        索引重新加载 (index.load()) 后需调用
+        """
+        components = self.index.list_components()
+        self._component_ids = [comp.id for comp in components]
+
+        # 建立 path -> id 的映射，用于从 include 路径查找组件 ID
+        # (键为 UTF-8 字节，与按字节匹配到的 include 路径直接比较)
+        self._path_to_id = {comp.path.encode("utf-8"): comp.id for comp in components}
 
     def analyze(self) -> Dict[str, int]:
         """分析所有模板文件，统计组件使用次数
@@ -33,38 +84,50 @@ class UsageStatistics:
             组件 ID 到使用次数的映射
         """
         # 初始化 usage_count，所有已注册组件初始为 0
-        usage_count: Dict[str, int] = {}
-        for comp in self.index.list_components():
-            usage_count[comp.id] = 0
-
-        # 建立 path -> id 的映射，用于从 include 路径查找组件 ID
-        path_to_id: Dict[str, str] = {}
-        for comp in self.index.list_components():
-            path_to_id[comp.path] = comp.id
+        usage_count: Dict[str, int] = dict.fromkeys(self._component_ids, 0)
+        path_to_id = self._path_to_id
 
         # 遍历所有 .html 文件
         if not self.templates_path.exists():
             return usage_count
 
-        for html_file in self.templates_path.rglob("*.html"):
-            # 跳过 components 目录下的文件（组件本身）
+        # 按 include 路径计数，最后再映射到组件 ID
+        # 文件 (mtime, size) 未变化时复用上次的匹配结果；已删除的文件随之移出缓存
+        include_count: Counter = Counter()
+        cache = self._include_cache
+        fresh: Dict[str, Tuple[Tuple[int, int], Counter]] = {}
+        for html_file in _iter_html_files(self.templates_path):
             try:
-                html_file.relative_to(self.templates_path / "components")
+                st = os.stat(html_file)
+            except OSError:
                 continue
-            except ValueError:
-                pass  # 不在 components 目录下，继续处理
-
-            try:
-                content = html_file.read_text(encoding="utf-8")
-            except Exception:
-                continue
-
-            # 查找所有 include 语句
-            for match in INCLUDE_PATTERN.finditer(content):
-                component_path = match.group(1)
-                if component_path in path_to_id:
-                    comp_id = path_to_id[component_path]
-                    usage_count[comp_id] = usage_count.get(comp_id, 0) + 1
+            stamp = (st.st_mtime_ns, st.st_size)
+
+            entry = cache.get(html_file)
+            if entry is None or entry[0] != stamp:
+                try:
+                    with open(html_file, "rb") as f:
+                        content = f.read()
+                except OSError:
+                    continue
+
+                try:
+                    # 只校验编码：非 UTF-8 模板不参与统计，记为空计数
+                    content.decode("utf-8")
+                except UnicodeDecodeError:
+                    entry = (stamp, Counter())
+                else:
+                    # 查找所有 include 语句
+                    entry = (stamp, Counter(INCLUDE_PATTERN_BYTES.findall(content)))
+
+            fresh[html_file] = entry
+            include_count.update(entry[1])
+
+        self._include_cache = fresh
+
+        for component_path, count in include_count.items():
+            if component_path in path_to_id:
+                usage_count[path_to_id[component_path]] += count
 
         return usage_count
 
@@ -18,7 +18,6 @@ Usage:
 import functools
 import logging
 import time
-import traceback
 from datetime import datetime
 from pathlib import Path
 from typing import Any, Callable, Dict, Optional
@@ -31,11 +30,35 @@ DEFAULT_LOG_FILE = Path("logs/devspec_cli_debug.log")
 LOG_FORMAT = "[%(asctime)s] %(levelname)s: %(message)s"
 DATE_FORMAT = "%Y-%m-%d %H:%M:%S"
 MAX_RESULT_LENGTH = 500  # Maximum characters for result output in log
+LOG_SEPARATOR = "=" * 80
+
+# %-style templates, formatted lazily by logging only if the record is emitted
+COMMAND_START_TEMPLATE = (
+    "\n" + LOG_SEPARATOR + "\n"
+    "COMMAND: %s\n"
+    "├─ EXECUTION_ID: %s\n"
+    "├─ ARGS: %s\n"
+    "├─ OPTIONS: %s\n"
+    "└─ START: %s\n"
+)
+COMMAND_END_TEMPLATE = (
+    "\n"
+    "RESULT: %s\n"
+    "├─ STATUS: %s\n"
+    "├─ DURATION: %.4fs\n"
+    "├─ END: %s\n"
+    "└─ OUTPUT:\n"
+    "%s\n" + LOG_SEPARATOR + "\n"
+)
 
 # === Module-level state ===
 
 _debug_logger: Optional[logging.Logger] = None
 
+# Bound info/error methods of _debug_logger, cached when it is created
+_debug_info: Optional[Callable[..., None]] = None
+_debug_error: Optional[Callable[..., None]] = None
+
 
 # === Internal helper functions ===
 
@@ -46,7 +69,7 @@ def _get_debug_logger() -> logging.Logger:
     Returns:
         Configured debug logger that writes to DEFAULT_LOG_FILE
     """
-    global _debug_logger
+    global _debug_logger, _debug_info, _debug_error
 
     if _debug_logger is not None:
         return _debug_logger
@@ -69,6 +92,7 @@ def _get_debug_logger() -> logging.Logger:
         logger.propagate = False  # Don't propagate to root logger
 
         _debug_logger = logger
+        _debug_info, _debug_error = logger.info, logger.error
         return logger
 
     except Exception as e:
@@ -77,6 +101,7 @@ def _get_debug_logger() -> logging.Logger:
         dummy_logger = logging.getLogger("devspec.cli.debug.dummy")
         dummy_logger.addHandler(logging.NullHandler())
         _debug_logger = dummy_logger
+        _debug_info, _debug_error = dummy_logger.info, dummy_logger.error
         return dummy_logger
 
 
@@ -93,19 +118,20 @@ def _log_command_start(
     Returns:
         Execution ID (timestamp-based)
     """
-    execution_id = datetime.now().isoformat()
-    logger = _get_debug_logger()
-
-    # Format log message
-    message = f"""
-{'=' * 80}
-COMMAND: {command_name}
-├─ EXECUTION_ID: {execution_id}
-├─ ARGS: {args}
-├─ OPTIONS: {options}
-└─ START: {datetime.now().strftime(DATE_FORMAT)}
-"""
-    logger.info(message)
+    # One clock reading for both the execution ID and the START field
+    now = datetime.now()
+    execution_id = now.isoformat()
+    if _debug_info is None:
+        _get_debug_logger()
+
+    _debug_info(
+        COMMAND_START_TEMPLATE,
+        command_name,
+        execution_id,
+        args,
+        options,
+        now.strftime(DATE_FORMAT),
+    )
 
     return execution_id
 
@@ -117,33 +143,38 @@ def _log_command_end(
 
     Args:
         execution_id: Execution ID from _log_command_start
-        result: Command return result (will be truncated to MAX_RESULT_LENGTH)
+        result: Command return result, or the raised exception on failure
+            (will be truncated to MAX_RESULT_LENGTH)
         duration: Execution duration in seconds
         success: Whether execution succeeded
     """
-    logger = _get_debug_logger()
+    if _debug_info is None:
+        _get_debug_logger()
+
+    # An exception's traceback is passed to logging as exc_info, so it is
+    # only formatted if the record is actually emitted
+    exc_info = None
+    if isinstance(result, BaseException):
+        exc_info = result
+        result_str = f"{type(result).__name__}: {result}"
+    else:
+        result_str = str(result)
 
-    # Convert result to string and truncate if needed
-    result_str = str(result)
+    # Truncate if needed
     if len(result_str) > MAX_RESULT_LENGTH:
         result_str = result_str[:MAX_RESULT_LENGTH] + "... (truncated)"
 
-    # Format log message
     status = "SUCCESS" if success else "FAILED"
-    message = f"""
-RESULT: {execution_id}
-├─ STATUS: {status}
-├─ DURATION: {duration:.4f}s
-├─ END: {datetime.now().strftime(DATE_FORMAT)}
-└─ OUTPUT:
-{result_str}
-{'=' * 80}
-"""
-
-    if success:
-        logger.info(message)
-    else:
-        logger.error(message)
+    log = _debug_info if success else _debug_error
+    log(
+        COMMAND_END_TEMPLATE,
+        execution_id,
+        status,
+        duration,
+        datetime.now().strftime(DATE_FORMAT),
+        result_str,
+        exc_info=exc_info,
+    )
 
 
 # === Public API ===
@@ -186,12 +217,12 @@ def debug_command(func: Callable) -> Callable:
 
         # Log command start
         execution_id = _log_command_start(command_name, args_dict, options_dict)
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
 
         try:
             # Execute command
             result = func(*args, **kwargs)
-            duration = time.time() - start_time
+            duration = (time.perf_counter_ns() - start_ns) / 1e9
 
             # Log success
             _log_command_end(execution_id, result, duration, success=True)
@@ -200,9 +231,8 @@ def debug_command(func: Callable) -> Callable:
 
         except Exception as e:
             # Log failure
-            duration = time.time() - start_time
-            error_details = f"{type(e).__name__}: {str(e)}\n\nTraceback:\n{traceback.format_exc()}"
-            _log_command_end(execution_id, error_details, duration, success=False)
+            duration = (time.perf_counter_ns() - start_ns) / 1e9
+            _log_command_end(execution_id, e, duration, success=False)
 
             # Re-raise the exception
             raise
@@ -15,15 +15,22 @@ Public APIs:
 - load_config(path): Load YAML config file
 - load_env_file(path): Load .env file
 - get_debug_mode(cli_flag): Get debug mode setting
+- invalidate_config_cache(): Drop cached config and debug mode
 """
 
+import functools
 import os
 import re
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Iterator, Optional, Sequence, Tuple
 
 import yaml
 
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:
+    from yaml import SafeLoader as _SafeLoader
+
 # === Constants ===
 
 DEFAULT_CONFIG: Dict[str, Any] = {
@@ -43,14 +50,33 @@ DEFAULT_CONFIG: Dict[str, Any] = {
 ENV_PREFIX = "DEVSPEC_"
 CONFIG_FILE_NAME = "config.yaml"
 ENV_FILE_NAME = ".env"
+_DEFAULT_CONFIG_PATH = Path(".specgraph") / CONFIG_FILE_NAME
+_DEFAULT_ENV_PATH = Path(ENV_FILE_NAME)
 DEBUG_ENV_KEYS = ["DEBUG", "DEVSPEC_DEBUG"]
-DEBUG_TRUE_VALUES = ["true", "1", "yes"]
-DEBUG_FALSE_VALUES = ["false", "0", "no"]
+DEBUG_TRUE_VALUES = frozenset({"true", "1", "yes"})
+DEBUG_FALSE_VALUES = frozenset({"false", "0", "no"})
+ENV_LINE_PATTERN = re.compile(r"^([A-Za-z_][A-Za-z0-9_]*)=(.*)$")
+
+# Escape sequences in quoted .env values, resolved in a single left-to-right pass;
+# the quote character may only be escaped inside values quoted with it
+ENV_ESCAPES = {"n": "\n", "t": "\t", "\\": "\\", '"': '"', "'": "'"}
+ENV_ESCAPE_PATTERNS = {
+    '"': re.compile(r'\\([nt\\"])'),
+    "'": re.compile(r"\\([nt\\'])"),
+}
+
+# DEVSPEC_* suffix -> config key in one pass: ASCII upper-case to lower-case, "_" to "."
+ENV_KEY_TRANSLATION = str.maketrans(
+    {**{chr(c): chr(c + 32) for c in range(ord("A"), ord("Z") + 1)}, "_": "."}
+)
 
 # === Module-level state (lazy initialization) ===
 
 _config: Optional[Dict[str, Any]] = None
 
+# Debug mode derived from the environment; reset whenever os.environ is changed here
+_debug_mode: Optional[bool] = None
+
 
 # === Public APIs ===
 
@@ -74,16 +100,12 @@ def get_config(key: str, default: Any = None) -> Any:
     global _config
     if _config is None:
         _config = _init_config()
+        _resolve.cache_clear()
 
-    # Navigate nested dict using dot notation
-    keys = key.split(".")
-    value = _config
-    for k in keys:
-        if isinstance(value, dict) and k in value:
-            value = value[k]
-        else:
-            return default
-    return value
+    try:
+        return _resolve(key)
+    except KeyError:
+        return default
 
 
 def load_config(path: Path) -> Dict[str, Any]:
@@ -100,10 +122,11 @@ def load_config(path: Path) -> Dict[str, Any]:
         yaml.YAMLError: If YAML syntax is invalid
     """
     content = path.read_text(encoding="utf-8")
-    return yaml.safe_load(content) or {}
+    # Same semantics as yaml.safe_load, parsed by libyaml when PyYAML was built with it
+    return yaml.load(content, Loader=_SafeLoader) or {}
 
 
-def load_env_file(path: Path = Path(".env")) -> None:
+def load_env_file(path: Path = _DEFAULT_ENV_PATH) -> None:
     """Load environment variables from .env file.
 
     Parses .env file manually (no python-dotenv dependency) and updates os.environ.
@@ -122,43 +145,48 @@ def load_env_file(path: Path = Path(".env")) -> None:
         DEBUG=true
         DEVSPEC_DATABASE_PATH="/custom/path"
     """
+    global _debug_mode
+
     if not path.exists():
         return
 
     try:
-        content = path.read_text(encoding="utf-8")
-        for line_num, line in enumerate(content.splitlines(), start=1):
-            line = line.strip()
-
-            # Skip empty lines and comments
-            if not line or line.startswith("#"):
-                continue
-
-            # Parse KEY=VALUE
-            match = re.match(r"^([A-Za-z_][A-Za-z0-9_]*)=(.*)$", line)
-            if not match:
-                # Log warning for malformed lines (but continue)
-                print(f"Warning: Malformed .env line {line_num}: {line}", file=os.sys.stderr)
-                continue
-
-            key, value = match.groups()
-
-            # Handle quoted values
-            value = value.strip()
-            if value and value[0] in ('"', "'"):
-                quote = value[0]
-                if len(value) > 1 and value[-1] == quote:
-                    value = value[1:-1]
-                    # Process escape sequences
-                    value = value.replace("\\n", "\n")
-                    value = value.replace("\\t", "\t")
-                    value = value.replace("\\\\", "\\")
-                    value = value.replace(f"\\{quote}", quote)
-
-            os.environ[key] = value
+        # Stream the file line by line instead of materializing it and its splitlines()
+        with path.open("r", encoding="utf-8") as f:
+            for line_num, line in enumerate(f, start=1):
+                line = line.strip()
+
+                # Skip empty lines and comments
+                if not line or line.startswith("#"):
+                    continue
+
+                # Parse KEY=VALUE
+                match = ENV_LINE_PATTERN.match(line)
+                if not match:
+                    # Log warning for malformed lines (but continue)
+                    print(f"Warning: Malformed .env line {line_num}: {line}", file=os.sys.stderr)
+                    continue
+
+                key, value = match.groups()
+
+                # Handle quoted values
+                value = value.strip()
+                if value and value[0] in ('"', "'"):
+                    quote = value[0]
+                    if len(value) > 1 and value[-1] == quote:
+                        value = value[1:-1]
+                        # Process escape sequences
+                        value = ENV_ESCAPE_PATTERNS[quote].sub(
+                            lambda m: ENV_ESCAPES[m.group(1)], value
+                        )
+
+                os.environ[key] = value
 
     except Exception as e:
         print(f"Warning: Failed to load .env file {path}: {e}", file=os.sys.stderr)
+    finally:
+        # .env may have set DEBUG / DEVSPEC_DEBUG
+        _debug_mode = None
 
 
 def get_debug_mode(cli_flag: Optional[bool] = None) -> bool:
@@ -174,11 +202,57 @@ def get_debug_mode(cli_flag: Optional[bool] = None) -> bool:
     1. CLI flag (if provided)
     2. Environment variable DEBUG or DEVSPEC_DEBUG
     3. Default (False)
+
+    The environment-derived value is computed once per process and cached;
+    call invalidate_config_cache() after changing DEBUG or DEVSPEC_DEBUG.
     """
+    global _debug_mode
+
     # Priority 1: CLI flag
     if cli_flag is not None:
         return cli_flag
 
+    if _debug_mode is None:
+        _debug_mode = _read_debug_env()
+    return _debug_mode
+
+
+def invalidate_config_cache() -> None:
+    """Drop the cached config and debug mode so they are re-read on next use.
+
+    Needed after changing os.environ (e.g. the --debug flag) or the config
+    files within the same process, such as in tests.
+    """
+    global _config, _debug_mode
+    _config = None
+    _debug_mode = None
+    _resolve.cache_clear()
+
+
+# === Internal helper functions ===
+
+
+@functools.lru_cache(maxsize=256)
+def _resolve(key: str) -> Any:
+    """Resolve a dot-notation key against the initialized config (memoized).
+
+    Cleared whenever _config is (re)initialized.
+
+    Raises:
+        KeyError: If the key does not exist
+    """
+    # Navigate nested dict using dot notation
+    value = _config
+    for k in key.split("."):
+        if isinstance(value, dict) and k in value:
+            value = value[k]
+        else:
+            raise KeyError(key)
+    return value
+
+
+def _read_debug_env() -> bool:
+    """Read debug mode from DEBUG / DEVSPEC_DEBUG (default False)."""
     # Priority 2: Environment variables
     for env_key in DEBUG_ENV_KEYS:
         env_value = os.environ.get(env_key)
@@ -193,9 +267,6 @@ def get_debug_mode(cli_flag: Optional[bool] = None) -> bool:
     return False
 
 
-# === Internal helper functions ===
-
-
 def _init_config() -> Dict[str, Any]:
     """Initialize and return merged config dictionary.
 
@@ -209,23 +280,23 @@ def _init_config() -> Dict[str, Any]:
         Merged configuration dictionary
     """
     # Step 1: Start with default config
-    import copy
-
-    config = copy.deepcopy(DEFAULT_CONFIG)
+    config = _clone_plain(DEFAULT_CONFIG)
 
     # Step 2: Load YAML config file (if exists)
-    config_path = Path(".specgraph") / CONFIG_FILE_NAME
+    config_path = _DEFAULT_CONFIG_PATH
     if config_path.exists():
         try:
             yaml_config = load_config(config_path)
-            config = _deep_merge(config, yaml_config)
+            # Apply YAML leaves onto the fresh default copy in place, the same
+            # way env overrides are applied in step 4
+            for path, value in _iter_leaves(yaml_config):
+                _set_path(config, path, value)
         except Exception as e:
             print(f"Warning: Failed to load config file {config_path}: {e}", file=os.sys.stderr)
 
     # Step 3: Load .env file (if exists)
     # Note: .env content updates os.environ, processed in step 4
-    env_path = Path(ENV_FILE_NAME)
-    load_env_file(env_path)
+    load_env_file(_DEFAULT_ENV_PATH)
 
     # Step 4: Apply system environment variable overrides (including from .env)
     _apply_env_overrides(config)
@@ -242,55 +313,93 @@ def _apply_env_overrides(config: Dict[str, Any]) -> None:
     Args:
         config: Configuration dictionary to modify in-place
     """
-    for key, value in os.environ.items():
-        if key.startswith(ENV_PREFIX):
-            # Remove prefix and convert to lowercase dot notation
-            config_key = key[len(ENV_PREFIX) :].lower().replace("_", ".")
-            _set_nested(config, config_key, value)
-
+    # Filter once up front; only DEVSPEC_* entries reach the per-key work below
+    overrides = [
+        (key, value) for key, value in os.environ.items() if key.startswith(ENV_PREFIX)
+    ]
+
+    prefix_len = len(ENV_PREFIX)
+    for key, value in overrides:
+        # Remove prefix and convert to lowercase dot notation
+        suffix = key[prefix_len:]
+        if suffix.isascii():
+            config_key = suffix.translate(ENV_KEY_TRANSLATION)
+        else:
+            # Non-ASCII names need full Unicode lower-casing
+            config_key = suffix.lower().replace("_", ".")
+        _set_nested(config, config_key, value)
 
-def _deep_merge(base: Dict[str, Any], override: Dict[str, Any]) -> Dict[str, Any]:
-    """Deep merge two dictionaries.
 
-    Args:
-        base: Base dictionary
-        override: Override dictionary (takes precedence)
+def _clone_plain(value: Any) -> Any:
+    """Deep-copy plain config data (nested dicts and lists).
 
-    Returns:
-        Merged dictionary (new dict, doesn't modify inputs)
+    Cheaper than copy.deepcopy for this shape of data: no memo dict and no
+    __deepcopy__ dispatch. Any other value (str, int, bool, None, ...) is
+    treated as immutable and shared.
     """
-    import copy
+    if isinstance(value, dict):
+        return {k: _clone_plain(v) for k, v in value.items()}
+    if isinstance(value, list):
+        return [_clone_plain(v) for v in value]
+    return value
+
 
-    result = copy.deepcopy(base)
+def _iter_leaves(data: Dict[str, Any]) -> Iterator[Tuple[Tuple[Any, ...], Any]]:
+    """Flatten a nested override dict into (key path, value) pairs.
 
-    for key, value in override.items():
-        if key in result and isinstance(result[key], dict) and isinstance(value, dict):
-            result[key] = _deep_merge(result[key], value)
+    Non-empty dicts are descended into; every other value, including an empty
+    dict, is yielded as a leaf.
+    """
+    # Depth-first in key order, so new keys land in the same order as the source
+    stack = [((), iter(data.items()))]
+    while stack:
+        prefix, items = stack[-1]
+        for key, value in items:
+            path = prefix + (key,)
+            if type(value) is dict and value:
+                stack.append((path, iter(value.items())))
+                break
+            yield path, value
         else:
-            result[key] = value
+            stack.pop()
 
-    return result
 
+def _set_path(config: Dict[str, Any], path: Sequence[Any], value: Any) -> None:
+    """Set a value in nested dict by key path, creating parent dicts as needed.
 
-def _set_nested(config: Dict[str, Any], key: str, value: Any) -> None:
-    """Set a value in nested dict using dot notation.
+    A dict value landing on an existing dict is merged (i.e. an empty dict is a
+    no-op), matching a deep merge; anything else replaces the current value.
+    Config data (defaults, YAML, env overrides) only ever holds plain dicts, so an
+    exact type check is enough here; dict subclasses are replaced, not merged.
 
     Args:
         config: Configuration dictionary to modify in-place
-        key: Dot-notation key (e.g., 'database.path')
+        path: Keys from the top level down to the leaf
         value: Value to set
     """
-    keys = key.split(".")
+    *parents, leaf = path
     current = config
 
-    # Navigate to the parent dict
-    for k in keys[:-1]:
-        if k not in current:
-            current[k] = {}
-        elif not isinstance(current[k], dict):
-            # Overwrite non-dict with dict to allow nested setting
-            current[k] = {}
-        current = current[k]
+    # Navigate to the parent dict, one lookup per level
+    for k in parents:
+        child = current.get(k)
+        if type(child) is not dict:
+            # Missing, or a non-dict overwritten with dict to allow nested setting
+            child = current[k] = {}
+        current = child
 
     # Set the final value
-    current[keys[-1]] = value
+    if type(value) is dict and type(current.get(leaf)) is dict:
+        return
+    current[leaf] = value
+
+
+def _set_nested(config: Dict[str, Any], key: str, value: Any) -> None:
+    """Set a value in nested dict using dot notation.
+
+    Args:
+        config: Configuration dictionary to modify in-place
+        key: Dot-notation key (e.g., 'database.path')
+        value: Value to set
+    """
+    _set_path(config, key.split("."), value)
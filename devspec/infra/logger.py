@@ -11,7 +11,7 @@ Public APIs:
 import logging
 import sys
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Optional
 
 try:
     from rich.logging import RichHandler
@@ -24,12 +24,12 @@ except ImportError:
 
 DEFAULT_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
 LOG_LEVELS = ["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"]
+_VALID_LEVELS = frozenset(LOG_LEVELS)
 DEFAULT_LEVEL = "INFO"
 DEFAULT_FORMAT_TYPE = "rich"
 
 # === Module-level state ===
 
-_loggers: Dict[str, logging.Logger] = {}
 _configured: bool = False
 
 
@@ -63,17 +63,19 @@ def configure_logging(
     root_logger = logging.getLogger()
 
     # Clear any existing handlers (avoid duplicates)
-    root_logger.handlers.clear()
+    if root_logger.handlers:
+        root_logger.handlers.clear()
 
     # Validate and set level
-    if level.upper() not in LOG_LEVELS:
+    level_upper = level.upper()
+    if level_upper not in _VALID_LEVELS:
         print(
             f"Warning: Invalid log level '{level}', using {DEFAULT_LEVEL}",
             file=sys.stderr,
         )
-        level = DEFAULT_LEVEL
+        level_upper = DEFAULT_LEVEL
 
-    root_logger.setLevel(level.upper())
+    root_logger.setLevel(level_upper)
 
     # Configure console handler based on format
     if format == "rich" and RICH_AVAILABLE:
@@ -121,7 +123,8 @@ def configure_logging(
 def get_logger(name: str) -> logging.Logger:
     """Get or create a named logger instance.
 
-    Loggers are cached to avoid creating duplicates. Child loggers automatically
+    logging.getLogger already returns the same instance per name, so no extra
+    cache is kept here. Child loggers automatically
     inherit configuration from the root logger (configured by configure_logging()).
 
     Args:
@@ -135,14 +138,5 @@ def get_logger(name: str) -> logging.Logger:
         >>> logger.info('Monitoring started')
         >>> logger.debug('Debug details')
     """
-    # Return cached logger if exists
-    if name in _loggers:
-        return _loggers[name]
-
-    # Create new logger (inherits from root logger)
-    logger = logging.getLogger(name)
-
-    # Cache it
-    _loggers[name] = logger
-
-    return logger
+    # Create or fetch logger (inherits from root logger)
+    return logging.getLogger(name)
@@ -6,28 +6,84 @@ Feature: feat_cli_command_structure
 
 Typer 应用主入口，负责命令注册与全局配置。
 """
+import importlib
 import os
-from pathlib import Path
+import sys
+from typing import Dict, List, Optional
 
+import click
 import typer
 from rich.console import Console
+from typer.core import TyperGroup
 
-from devspec.commands.init import init
-from devspec.commands.monitor import monitor
-from devspec.commands.validate_prd import validate_prd
-from devspec.commands.context import context
-from devspec.commands.sync import sync
-from devspec.commands.serve import serve
-from devspec.frontend import frontend_app
 from devspec.infra.cli_debug_logger import debug_command
-from devspec.infra.config import load_env_file, get_config
+from devspec.infra.config import load_env_file, get_config, invalidate_config_cache
 from devspec.infra.logger import configure_logging
 
+# === Lazily Loaded Commands ===
+
+# 命令名 -> (模块路径, 属性名, 帮助文本)；模块仅在该命令被解析时导入
+# 帮助文本为 None 表示属性是 Typer 子命令组 (add_typer)
+LAZY_COMMANDS = {
+    "init": ("devspec.commands.init", "init", "Initialize DevSpec for AI CLI integration (Claude Code, Gemini CLI)."),
+    "monitor": ("devspec.commands.monitor", "monitor", "Run PRD-Spec consistency check and generate dashboard."),
+    "validate-prd": ("devspec.commands.validate_prd", "validate_prd", "Validate PRD.md format against the canonical structure."),
+    "context": ("devspec.commands.context", "context", "Output phase-specific context for AI agents."),
+    "sync": ("devspec.commands.sync", "sync", "Synchronize all YAML spec files to the database."),
+    "serve": ("devspec.commands.serve", "serve", "Start the SpecGraph Viewer web server."),
+    "frontend": ("devspec.frontend", "frontend_app", None),
+}
+
+
+class LazyTyperGroup(TyperGroup):
+    """Typer 命令组：LAZY_COMMANDS 中的命令在首次被解析时才导入并构建"""
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self._lazy_loaded: Dict[str, click.Command] = {}
+
+    def list_commands(self, ctx: click.Context) -> List[str]:
+        # 与 Typer 一致：普通命令在前，子命令组在后
+        commands = [name for name, spec in LAZY_COMMANDS.items() if spec[2] is not None]
+        groups = [name for name, spec in LAZY_COMMANDS.items() if spec[2] is None]
+        return [*commands, *super().list_commands(ctx), *groups]
+
+    def get_command(self, ctx: click.Context, cmd_name: str) -> Optional[click.Command]:
+        if cmd_name not in LAZY_COMMANDS:
+            return super().get_command(ctx, cmd_name)
+
+        command = self._lazy_loaded.get(cmd_name)
+        if command is None:
+            command = self._lazy_loaded[cmd_name] = _load_command(cmd_name)
+        return command
+
+
+def _load_command(cmd_name: str) -> click.Command:
+    """导入命令所在模块，并按原注册方式 (debug_command 包装) 构建 click 命令"""
+    module_path, attr, help_text = LAZY_COMMANDS[cmd_name]
+    target = getattr(importlib.import_module(module_path), attr)
+
+    holder = typer.Typer(add_completion=False)
+    if help_text is None:
+        # Typer 子命令组
+        holder.add_typer(target, name=cmd_name)
+        return typer.main.get_command(holder).commands[cmd_name]
+
+    # 仅含单个命令的 Typer 应用直接构建为该命令本身
+    holder.command(name=cmd_name, help=help_text)(debug_command(target))
+    return typer.main.get_command(holder)
+
+
+# 仅输出帮助的调用无需加载 .env 与配置日志 (注意 -h 被 serve 用作 --host)
+HELP_FLAGS = frozenset({"--help"})
+
+
 # Initialize Typer app
 app = typer.Typer(
     name="devspec",
     help="DevSpec: A self-evolving, serial conversational intelligent pair-programming environment.",
     add_completion=False,
+    cls=LazyTyperGroup,
 )
 
 console = Console()
@@ -48,21 +104,12 @@ def global_options(
     """Global options callback for --debug flag."""
     if debug:
         os.environ['DEBUG'] = 'true'
+        invalidate_config_cache()
 
 
 # === Register Commands with Debug Decorator ===
-
-app.command(name="init", help="Initialize DevSpec for AI CLI integration (Claude Code, Gemini CLI).")(debug_command(init))
-app.command(name="monitor", help="Run PRD-Spec consistency check and generate dashboard.")(debug_command(monitor))
-app.command(name="validate-prd", help="Validate PRD.md format against the canonical structure.")(debug_command(validate_prd))
-app.command(name="context", help="Output phase-specific context for AI agents.")(debug_command(context))
-app.command(name="sync", help="Synchronize all YAML spec files to the database.")(debug_command(sync))
-
-# Register subcommand groups
-app.add_typer(frontend_app, name="frontend")
-
-
-app.command(name="serve", help="Start the SpecGraph Viewer web server.")(debug_command(serve))
+# init / monitor / validate-prd / context / sync / serve / frontend 由 LazyTyperGroup
+# 按需加载 (见 LAZY_COMMANDS)；以下为无额外依赖、直接注册的命令
 
 
 @app.command(name="generate")
@@ -79,7 +126,15 @@ def main():
     1. Load .env file (if exists)
     2. Configure global logging based on config
     3. Start Typer application
+
+    Steps 1-2 are skipped when only help will be printed (no arguments, or
+    --help anywhere on the command line).
     """
+    args = sys.argv[1:]
+    if not args or not HELP_FLAGS.isdisjoint(args):
+        app()
+        return
+
     # Load .env file (if exists)
     load_env_file()
 
@@ -8,10 +8,11 @@ Component: comp_specview_graph_renderer
 Feature: feat_specview_relation_view
 """
 
+from collections import OrderedDict, defaultdict
 from dataclasses import dataclass, field
 from typing import Dict, List, Optional
 
-from sqlmodel import select
+from sqlmodel import Session, or_, select
 
 from devspec.core.graph_database import GraphDatabase, NodeModel, EdgeModel
 
@@ -64,6 +65,110 @@ EDGE_ARROWS = {
     "realized_by": "-.->",  # dashed arrow
 }
 
+# Upper bound on cached SVGs per renderer; least recently used entries are evicted
+MAX_SVG_CACHE_ENTRIES = 256
+
+# Mermaid node IDs may not contain hyphens
+MERMAID_ID_TRANSLATION = str.maketrans({"-": "_"})
+
+# Relations followed from a node to its targets, and from a node back to its sources
+OUTGOING_RELATIONS = frozenset({"depends_on", "realized_by"})
+INCOMING_RELATIONS = frozenset({"depends_on"})
+
+
+# =============================================================================
+# Traversal
+# =============================================================================
+
+def collect_relations(session: Session, node_id: str, depth: int = 2) -> RelationGraph:
+    """
+    Collect the relation graph around a node, one BFS level at a time.
+
+    Each level costs two queries (frontier nodes, then all their edges) instead
+    of three per visited node. Nodes and edges come out in the same order as a
+    node-by-node BFS that visits out-edges before in-edges.
+
+    Args:
+        session: Open database session
+        node_id: Center node ID
+        depth: Traversal depth (default 2 levels)
+
+    Returns:
+        RelationGraph with nodes and edges
+    """
+    visited: set = set()
+    nodes: List[GraphNode] = []
+    edges: List[GraphEdge] = []
+
+    frontier = [node_id]
+    for _ in range(depth + 1):
+        # First occurrence wins; nodes reached on an earlier level are not revisited
+        frontier = [
+            current_id for current_id in dict.fromkeys(frontier) if current_id not in visited
+        ]
+        if not frontier:
+            break
+        visited.update(frontier)
+
+        found = {
+            node.id: node
+            for node in session.exec(select(NodeModel).where(NodeModel.id.in_(frontier))).all()
+        }
+        if not found:
+            break
+        found_ids = list(found)
+
+        # Bucket this level's edges per node, keeping insertion (id) order
+        out_edges: Dict[str, List[EdgeModel]] = defaultdict(list)
+        in_edges: Dict[str, List[EdgeModel]] = defaultdict(list)
+        level_edges = session.exec(
+            select(EdgeModel)
+            .where(or_(EdgeModel.source_id.in_(found_ids), EdgeModel.target_id.in_(found_ids)))
+            .order_by(EdgeModel.id)
+        ).all()
+        for edge in level_edges:
+            if edge.source_id in found and edge.relation in OUTGOING_RELATIONS:
+                out_edges[edge.source_id].append(edge)
+            if edge.target_id in found and edge.relation in INCOMING_RELATIONS:
+                in_edges[edge.target_id].append(edge)
+
+        next_frontier = []
+        for current_id in frontier:
+            node = found.get(current_id)
+            if not node:
+                continue
+
+            nodes.append(GraphNode(
+                id=node.id,
+                label=node.name or node.id,
+                type=node.type,
+            ))
+
+            for edge in out_edges[current_id]:
+                edges.append(GraphEdge(
+                    source=current_id,
+                    target=edge.target_id,
+                    relation=edge.relation,
+                ))
+                next_frontier.append(edge.target_id)
+
+            # Reverse relations (depended_by), drawn as the original edge
+            for edge in in_edges[current_id]:
+                edges.append(GraphEdge(
+                    source=edge.source_id,
+                    target=current_id,
+                    relation=edge.relation,
+                ))
+                next_frontier.append(edge.source_id)
+
+        frontier = next_frontier
+
+    return RelationGraph(
+        center_node=node_id,
+        nodes=nodes,
+        edges=edges,
+    )
+
 
 # =============================================================================
 # GraphRenderer Class
@@ -85,7 +190,8 @@ class GraphRenderer:
             db: SpecGraph database instance
         """
         self.db = db
-        self._svg_cache: Dict[str, str] = {}
+        # "node_id:depth" -> SVG, in LRU order (most recently used last)
+        self._svg_cache: "OrderedDict[str, str]" = OrderedDict()
 
     def get_node_relations(self, node_id: str, depth: int = 2) -> RelationGraph:
         """
@@ -98,67 +204,8 @@ class GraphRenderer:
         Returns:
             RelationGraph with nodes and edges
         """
-        visited: set = set()
-        nodes: List[GraphNode] = []
-        edges: List[GraphEdge] = []
-
-        # BFS queue: (node_id, current_depth)
-        queue = [(node_id, 0)]
-
         with self.db.get_session() as session:
-            while queue:
-                current_id, current_depth = queue.pop(0)
-
-                if current_id in visited or current_depth > depth:
-                    continue
-
-                visited.add(current_id)
-                node = session.get(NodeModel, current_id)
-
-                if not node:
-                    continue
-
-                # Add node
-                nodes.append(GraphNode(
-                    id=node.id,
-                    label=node.name or node.id,
-                    type=node.type,
-                ))
-
-                # Get outgoing edges
-                out_edges = session.exec(
-                    select(EdgeModel).where(EdgeModel.source_id == current_id)
-                ).all()
-
-                for edge in out_edges:
-                    if edge.relation in ("depends_on", "realized_by"):
-                        edges.append(GraphEdge(
-                            source=current_id,
-                            target=edge.target_id,
-                            relation=edge.relation,
-                        ))
-                        queue.append((edge.target_id, current_depth + 1))
-
-                # Get incoming edges (for reverse relations)
-                in_edges = session.exec(
-                    select(EdgeModel).where(EdgeModel.target_id == current_id)
-                ).all()
-
-                for edge in in_edges:
-                    if edge.relation == "depends_on":
-                        # Add reverse edge (depended_by)
-                        edges.append(GraphEdge(
-                            source=edge.source_id,
-                            target=current_id,
-                            relation="depends_on",
-                        ))
-                        queue.append((edge.source_id, current_depth + 1))
-
-        return RelationGraph(
-            center_node=node_id,
-            nodes=nodes,
-            edges=edges,
-        )
+            return collect_relations(session, node_id, depth)
 
     def generate_mermaid(self, node_id: str, depth: int = 2) -> str:
         """
@@ -175,28 +222,27 @@ class GraphRenderer:
 
         lines = ["graph LR"]
 
+        # Sanitize IDs for Mermaid once per node; edges reuse them
+        safe_ids = {node.id: node.id.translate(MERMAID_ID_TRANSLATION) for node in graph.nodes}
+
         # Add node definitions
         for node in graph.nodes:
-            # Sanitize ID for Mermaid (replace hyphens)
-            safe_id = node.id.replace("-", "_")
+            safe_id = safe_ids[node.id]
             lines.append(f'  {safe_id}["{node.label}"]')
 
             # Add style
             style = NODE_STYLES.get(node.type, NODE_STYLES["design"])
             lines.append(f"  style {safe_id} fill:{style['fill']},color:#fff")
 
-        # Add edge definitions (deduplicate)
-        seen_edges: set = set()
-        for edge in graph.edges:
-            edge_key = (edge.source, edge.target, edge.relation)
-            if edge_key not in seen_edges:
-                seen_edges.add(edge_key)
-
-                source = edge.source.replace("-", "_")
-                target = edge.target.replace("-", "_")
-                arrow = EDGE_ARROWS.get(edge.relation, "-->")
+        # Add edge definitions (deduplicated up front, first occurrence order kept)
+        edge_keys = dict.fromkeys((edge.source, edge.target, edge.relation) for edge in graph.edges)
+        for source, target, relation in edge_keys:
+            # Edge endpoints beyond the traversal depth have no node entry
+            source = safe_ids.get(source) or source.translate(MERMAID_ID_TRANSLATION)
+            target = safe_ids.get(target) or target.translate(MERMAID_ID_TRANSLATION)
+            arrow = EDGE_ARROWS.get(relation, "-->")
 
-                lines.append(f"  {source} {arrow} {target}")
+            lines.append(f"  {source} {arrow} {target}")
 
         return "\n".join(lines)
 
@@ -234,7 +280,10 @@ class GraphRenderer:
             Cached SVG string or None if not cached
         """
         cache_key = f"{node_id}:{depth}"
-        return self._svg_cache.get(cache_key)
+        svg = self._svg_cache.get(cache_key)
+        if svg is not None:
+            self._svg_cache.move_to_end(cache_key)
+        return svg
 
     def render_and_cache(self, node_id: str, depth: int = 2) -> str:
         """
@@ -249,16 +298,18 @@ class GraphRenderer:
         """
         # Check cache first
         cached = self.get_cached_svg(node_id, depth)
-        if cached:
+        if cached is not None:
             return cached
 
         # Generate and render
         mermaid_code = self.generate_mermaid(node_id, depth)
         svg = self.render_svg(mermaid_code)
 
-        # Cache result
+        # Cache result, evicting the least recently used entries beyond the bound
         cache_key = f"{node_id}:{depth}"
         self._svg_cache[cache_key] = svg
+        while len(self._svg_cache) > MAX_SVG_CACHE_ENTRIES:
+            self._svg_cache.popitem(last=False)
 
         return svg
 
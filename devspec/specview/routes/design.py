@@ -12,6 +12,7 @@ from fastapi.responses import HTMLResponse
 from sqlmodel import select
 
 from devspec.specview.server import get_db, get_templates
+from devspec.core._yaml_cache import parse_yaml
 from devspec.core.graph_database import NodeModel
 
 
@@ -54,7 +55,16 @@ async def design_view(request: Request) -> HTMLResponse:
     substrates = []
 
     with db.get_session() as session:
-        all_nodes = session.exec(select(NodeModel)).all()
+        # Only the listed columns; raw_yaml is not needed for the index
+        all_nodes = session.exec(
+            select(
+                NodeModel.id,
+                NodeModel.type,
+                NodeModel.name,
+                NodeModel.description,
+                NodeModel.intent,
+            ).where(NodeModel.type.in_(["design", "substrate"]))
+        ).all()
 
         for node in all_nodes:
             node_info = {
@@ -113,7 +123,7 @@ async def design_detail(request: Request, design_id: str) -> HTMLResponse:
         if node.raw_yaml:
             import yaml
             try:
-                content = yaml.safe_load(node.raw_yaml)
+                content = parse_yaml(node.raw_yaml)
             except yaml.YAMLError:
                 pass
 
@@ -171,7 +181,7 @@ async def substrate_detail(request: Request, substrate_id: str) -> HTMLResponse:
         if node.raw_yaml:
             import yaml
             try:
-                content = yaml.safe_load(node.raw_yaml)
+                content = parse_yaml(node.raw_yaml)
             except yaml.YAMLError:
                 pass
 
@@ -5,12 +5,12 @@ Component: comp_specview_routes
 Feature: feat_specview_hierarchy_view
 """
 
-from typing import List, Optional
+from typing import Dict, Iterable, List, Optional
 
 from fastapi import APIRouter, Request
 from fastapi.responses import HTMLResponse
 from pydantic import BaseModel
-from sqlmodel import select
+from sqlmodel import func, select
 
 from devspec.specview.server import get_db, get_templates
 from devspec.core.graph_database import NodeModel, EdgeModel
@@ -44,20 +44,15 @@ async def hierarchy_view(request: Request) -> HTMLResponse:
             select(NodeModel).where(NodeModel.type == "domain")
         ).all()
 
-        for domain in domain_nodes:
-            # Count features for this domain
-            feature_count = session.exec(
-                select(EdgeModel).where(
-                    EdgeModel.source_id == domain.id,
-                    EdgeModel.relation == "owns",
-                )
-            ).all()
+        # Count features for all domains in one grouped query
+        feature_counts = _count_edges_by_source(session, "owns")
 
+        for domain in domain_nodes:
             domains.append({
                 "id": domain.id,
                 "name": domain.name,
                 "description": domain.description,
-                "feature_count": len(feature_count),
+                "feature_count": feature_counts.get(domain.id, 0),
             })
 
     return templates.TemplateResponse(
@@ -94,22 +89,19 @@ async def get_domain_children(request: Request, domain_id: str) -> HTMLResponse:
             )
         ).all()
 
+        # Load the features and their component counts in one query each
+        feature_ids = list({edge.target_id for edge in edges})
+        feature_nodes = _get_nodes_by_id(session, feature_ids)
+        component_counts = _count_edges_by_source(session, "realized_by", feature_ids)
+
         for edge in edges:
-            feature = session.get(NodeModel, edge.target_id)
+            feature = feature_nodes.get(edge.target_id)
             if feature:
-                # Count components for this feature
-                comp_edges = session.exec(
-                    select(EdgeModel).where(
-                        EdgeModel.source_id == feature.id,
-                        EdgeModel.relation == "realized_by",
-                    )
-                ).all()
-
                 features.append({
                     "id": feature.id,
                     "name": feature.name or feature.id,
                     "intent": feature.intent,
-                    "component_count": len(comp_edges),
+                    "component_count": component_counts.get(feature.id, 0),
                 })
 
     return templates.TemplateResponse(
@@ -145,8 +137,10 @@ async def get_feature_children(request: Request, feature_id: str) -> HTMLRespons
             )
         ).all()
 
+        component_nodes = _get_nodes_by_id(session, {edge.target_id for edge in edges})
+
         for edge in edges:
-            component = session.get(NodeModel, edge.target_id)
+            component = component_nodes.get(edge.target_id)
             if component:
                 components.append({
                     "id": component.id,
@@ -254,6 +248,30 @@ async def node_detail(request: Request, node_type: str, node_id: str) -> HTMLRes
         )
 
 
+def _get_nodes_by_id(session, node_ids: Iterable[str]) -> Dict[str, NodeModel]:
+    """Fetch nodes by ID with a single IN query (missing IDs are simply absent)."""
+    node_ids = list(node_ids)
+    if not node_ids:
+        return {}
+    nodes = session.exec(select(NodeModel).where(NodeModel.id.in_(node_ids))).all()
+    return {node.id: node for node in nodes}
+
+
+def _count_edges_by_source(
+    session, relation: str, source_ids: Optional[List[str]] = None
+) -> Dict[str, int]:
+    """Count edges of one relation per source node with a single GROUP BY query.
+
+    Restricted to source_ids when given; sources without edges are absent.
+    """
+    statement = select(EdgeModel.source_id, func.count()).where(EdgeModel.relation == relation)
+    if source_ids is not None:
+        if not source_ids:
+            return {}
+        statement = statement.where(EdgeModel.source_id.in_(source_ids))
+    return dict(session.exec(statement.group_by(EdgeModel.source_id)).all())
+
+
 def _build_breadcrumb(session, node: NodeModel) -> List[dict]:
     """Build breadcrumb navigation path for a node."""
     breadcrumbs = [{"name": "Hierarchy", "url": "/hierarchy"}]
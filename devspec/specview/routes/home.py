@@ -7,7 +7,7 @@ Feature: feat_specview_dashboard_core
 
 from fastapi import APIRouter, Request
 from fastapi.responses import HTMLResponse
-from sqlmodel import select
+from sqlmodel import func, select
 
 from devspec.specview.server import get_db, get_templates, get_navigation_guide
 from devspec.core.graph_database import NodeModel
@@ -52,16 +52,19 @@ async def home(request: Request) -> HTMLResponse:
             "designs": 0,
         }
 
-        all_nodes = session.exec(select(NodeModel)).all()
-        for node in all_nodes:
-            if node.type == "domain":
-                stats["domains"] += 1
-            elif node.type == "feature":
-                stats["features"] += 1
-            elif node.type == "component":
-                stats["components"] += 1
-            elif node.type in ("design", "substrate"):
-                stats["designs"] += 1
+        # Let SQLite count per type instead of loading every node
+        type_counts = session.exec(
+            select(NodeModel.type, func.count()).group_by(NodeModel.type)
+        ).all()
+        for node_type, count in type_counts:
+            if node_type == "domain":
+                stats["domains"] += count
+            elif node_type == "feature":
+                stats["features"] += count
+            elif node_type == "component":
+                stats["components"] += count
+            elif node_type in ("design", "substrate"):
+                stats["designs"] += count
 
     return templates.TemplateResponse(
         "home.html",
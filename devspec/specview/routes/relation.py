@@ -13,6 +13,7 @@ from sqlmodel import select
 
 from devspec.specview.server import get_db, get_templates
 from devspec.core.graph_database import NodeModel, EdgeModel
+from devspec.specview.graph_renderer import MERMAID_ID_TRANSLATION, collect_relations
 
 
 router = APIRouter(tags=["relation"])
@@ -218,57 +219,8 @@ def _generate_mermaid_graph(session, center_node_id: str, depth: int = 2) -> str
     Returns:
         Mermaid graph definition string
     """
-    # BFS to collect nodes and edges
-    visited = set()
-    nodes = []
-    edges = []
-    queue = [(center_node_id, 0)]
-
-    while queue:
-        current_id, current_depth = queue.pop(0)
-
-        if current_id in visited or current_depth > depth:
-            continue
-
-        visited.add(current_id)
-        node = session.get(NodeModel, current_id)
-
-        if not node:
-            continue
-
-        nodes.append({
-            "id": current_id,
-            "label": node.name or current_id,
-            "type": node.type,
-        })
-
-        # Get outgoing edges
-        out_edges = session.exec(
-            select(EdgeModel).where(EdgeModel.source_id == current_id)
-        ).all()
-
-        for edge in out_edges:
-            if edge.relation in ("depends_on", "realized_by"):
-                edges.append({
-                    "source": current_id,
-                    "target": edge.target_id,
-                    "relation": edge.relation,
-                })
-                queue.append((edge.target_id, current_depth + 1))
-
-        # Get incoming edges (for depended_by)
-        in_edges = session.exec(
-            select(EdgeModel).where(EdgeModel.target_id == current_id)
-        ).all()
-
-        for edge in in_edges:
-            if edge.relation == "depends_on":
-                edges.append({
-                    "source": edge.source_id,
-                    "target": current_id,
-                    "relation": edge.relation,
-                })
-                queue.append((edge.source_id, current_depth + 1))
+    # BFS to collect nodes and edges (batched per level)
+    graph = collect_relations(session, center_node_id, depth)
 
     # Generate Mermaid code
     lines = ["graph LR"]
@@ -281,12 +233,15 @@ def _generate_mermaid_graph(session, center_node_id: str, depth: int = 2) -> str
         "design": "#F59E0B",  # amber
     }
 
+    # Sanitize IDs for Mermaid once per node; edges reuse them
+    safe_ids = {node.id: node.id.translate(MERMAID_ID_TRANSLATION) for node in graph.nodes}
+
     # Add nodes
-    for node in nodes:
-        safe_id = node["id"].replace("-", "_")
-        lines.append(f'  {safe_id}["{node["label"]}"]')
+    for node in graph.nodes:
+        safe_id = safe_ids[node.id]
+        lines.append(f'  {safe_id}["{node.label}"]')
 
-        color = node_styles.get(node["type"], "#6B7280")
+        color = node_styles.get(node.type, "#6B7280")
         lines.append(f"  style {safe_id} fill:{color},color:#fff")
 
     # Add edges
@@ -295,14 +250,13 @@ def _generate_mermaid_graph(session, center_node_id: str, depth: int = 2) -> str
         "realized_by": "-.->",
     }
 
-    seen_edges = set()
-    for edge in edges:
-        edge_key = (edge["source"], edge["target"], edge["relation"])
-        if edge_key not in seen_edges:
-            seen_edges.add(edge_key)
-            source = edge["source"].replace("-", "_")
-            target = edge["target"].replace("-", "_")
-            arrow = edge_arrows.get(edge["relation"], "-->")
-            lines.append(f"  {source} {arrow} {target}")
+    # Deduplicate up front, keeping first occurrence order
+    edge_keys = dict.fromkeys((edge.source, edge.target, edge.relation) for edge in graph.edges)
+    for source, target, relation in edge_keys:
+        # Edge endpoints beyond the traversal depth have no node entry
+        source = safe_ids.get(source) or source.translate(MERMAID_ID_TRANSLATION)
+        target = safe_ids.get(target) or target.translate(MERMAID_ID_TRANSLATION)
+        arrow = edge_arrows.get(relation, "-->")
+        lines.append(f"  {source} {arrow} {target}")
 
     return "\n".join(lines)
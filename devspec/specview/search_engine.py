@@ -62,6 +62,14 @@ MAX_SUGGESTIONS = 10
 SNIPPET_CONTEXT_CHARS = 50
 MAX_SEARCH_RESULTS = 50
 
+# Node fields checked by the fallback search, with the score of a match
+SIMPLE_SEARCH_FIELDS = (
+    ("id", 3),
+    ("name", 2),
+    ("description", 1),
+    ("intent", 1),
+)
+
 # FTS5 SQL statements
 FTS5_CREATE_SQL = """
 CREATE VIRTUAL TABLE IF NOT EXISTS nodes_fts USING fts5(
@@ -278,30 +286,18 @@ class SearchEngine:
     ) -> List[SearchResultItem]:
         """Perform simple text search (fallback)."""
         query_lower = query.lower()
-        all_nodes = session.exec(select(NodeModel)).all()
+        statement = select(NodeModel)
+        if type_filter:
+            statement = statement.where(NodeModel.type == type_filter)
+        all_nodes = session.exec(statement).all()
 
         scored_nodes = []
         for node in all_nodes:
-            if type_filter and node.type != type_filter:
-                continue
-
             score = 0
-
-            # Check ID
-            if query_lower in node.id.lower():
-                score += 3
-
-            # Check name
-            if node.name and query_lower in node.name.lower():
-                score += 2
-
-            # Check description
-            if node.description and query_lower in node.description.lower():
-                score += 1
-
-            # Check intent
-            if node.intent and query_lower in node.intent.lower():
-                score += 1
+            for field_name, weight in SIMPLE_SEARCH_FIELDS:
+                value = getattr(node, field_name)
+                if value and query_lower in value.lower():
+                    score += weight
 
             if score > 0:
                 scored_nodes.append((node, score))
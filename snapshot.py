@@ -6,48 +6,55 @@ INCLUDE_DIRS = [".specgraph", "devspec"]
 INCLUDE_EXTS = {".yaml", ".py", ".md", ".toml"}
 IGNORE_DIRS = {"__pycache__", ".venv", ".git", ".devspec"}
 
+def _iter_sorted(dir_path, depth=0):
+    """逐目录排序遍历，顺序与 sorted(rglob("*")) 相同，但无需先收集全部路径再全局排序"""
+    with os.scandir(dir_path) as it:
+        entries = sorted(it, key=lambda e: e.name)
+    for entry in entries:
+        # 跳过忽略的目录，不再进入其子树
+        if entry.name in IGNORE_DIRS:
+            continue
+        is_dir = entry.is_dir()
+        yield Path(entry.path), depth, is_dir
+        if is_dir:
+            yield from _iter_sorted(entry.path, depth + 1)
+
 def generate_snapshot():
     output = []
+    contents = []
     root = Path(".")
     
     output.append("# PROJECT SNAPSHOT")
     output.append(f"Root: {root.resolve().name}\n")
     
-    # 1. 先打印目录树结构
+    # 一次遍历同时生成 1. 目录树结构 和 2. 文件内容
     output.append("## 1. Directory Structure")
-    for path in sorted(root.rglob("*")):
-        # 过滤忽略的目录
-        if any(part in IGNORE_DIRS for part in path.parts):
-            continue
-        if path.is_dir():
-            depth = len(path.relative_to(root).parts)
-            indent = "  " * (depth - 1)
+    for path, depth, is_dir in _iter_sorted(root):
+        indent = "  " * depth
+        if is_dir:
             output.append(f"{indent}📂 {path.name}/")
-        elif path.suffix in INCLUDE_EXTS:
-            depth = len(path.relative_to(root).parts)
-            indent = "  " * (depth - 1)
-            output.append(f"{indent}📄 {path.name}")
+            continue
+
+        # 只读取特定后缀的文件
+        if path.suffix not in INCLUDE_EXTS:
+            continue
+        output.append(f"{indent}📄 {path.name}")
+
+        # 排除 snapshot.py 自己
+        if path.name == "snapshot.py" or not path.is_file():
+            continue
+
+        contents.append(f"\n--- START OF FILE {path} ---")
+        try:
+            content = path.read_text(encoding="utf-8")
+            contents.append(content)
+        except Exception as e:
+            contents.append(f"(Error reading file: {e})")
+        contents.append(f"--- END OF FILE {path} ---\n")
 
     # 2. 打印文件内容
     output.append("\n## 2. File Contents")
-    for path in sorted(root.rglob("*")):
-        # 过滤忽略的目录
-        if any(part in IGNORE_DIRS for part in path.parts):
-            continue
-        
-        # 只读取特定后缀的文件
-        if path.is_file() and path.suffix in INCLUDE_EXTS:
-            # 排除 snapshot.py 自己
-            if path.name == "snapshot.py": 
-                continue
-                
-            output.append(f"\n--- START OF FILE {path} ---")
-            try:
-                content = path.read_text(encoding="utf-8")
-                output.append(content)
-            except Exception as e:
-                output.append(f"(Error reading file: {e})")
-            output.append(f"--- END OF FILE {path} ---\n")
+    output.extend(contents)
 
     return "\n".join(output)
 